@@ -0,0 +1,25 @@
+"""Add composite index on jobs (user_id, source_url).
+
+Revision ID: h4i5j6k7l8m9
+Revises: g3h4i5j6k7l8
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "h4i5j6k7l8m9"
+down_revision = "g3h4i5j6k7l8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicate checks look jobs up by (user_id, source_url) for every
+    # processed email; make that an index probe instead of a scan
+    op.create_index("ix_jobs_user_id_source_url", "jobs", ["user_id", "source_url"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_user_id_source_url", table_name="jobs")
@@ -0,0 +1,63 @@
+"""Sync/async I/O policy for route handlers.
+
+Handlers are either ``async def`` and only await non-blocking I/O (the async
+SQLAlchemy session, httpx, ...), or plain ``def`` and run in the threadpool.
+Mixing the two - blocking work inside an ``async def`` handler, or a sync
+handler holding an async DB session - stalls the event loop or starves the
+threadpool under concurrent load.
+"""
+
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from typing import ParamSpec, TypeVar
+
+import anyio.to_thread
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+from src.db.session import get_db
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def io_bound(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Turn a blocking function into an awaitable that runs in a worker thread.
+
+    Use for blocking calls (file parsing, sync SDKs) made from async handlers.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+
+    return wrapper
+
+
+def _uses_async_db(dependant: Dependant) -> bool:
+    """Whether a dependency tree pulls in the async DB session."""
+    return any(
+        sub.call is get_db or _uses_async_db(sub) for sub in dependant.dependencies
+    )
+
+
+def check_route_io_policy(routes: Iterable[BaseRoute]) -> None:
+    """Fail fast if a route handler violates the sync/async I/O policy.
+
+    Raises:
+        RuntimeError: If a sync handler depends on the async DB session
+    """
+    violations = [
+        f"{', '.join(sorted(route.methods))} {route.path} ({route.endpoint.__qualname__})"
+        for route in routes
+        if isinstance(route, APIRoute)
+        and not inspect.iscoroutinefunction(route.endpoint)
+        and _uses_async_db(route.dependant)
+    ]
+    if violations:
+        raise RuntimeError(
+            "Sync route handlers cannot use the async DB session; make them "
+            "'async def': " + "; ".join(violations)
+        )
@@ -91,6 +91,7 @@ class EmailIngestRequest(BaseModel):
 
     # Pipeline options
     save_job: bool = True
+    save_all_jobs: bool = False
     adapt_cv: bool = False
     generate_cover_letter: bool = False
     start_application: bool = False
@@ -184,6 +185,7 @@ async def ingest_email(
     # Build pipeline options
     options = PipelineOptions(
         save_job=request.save_job,
+        save_all_jobs=request.save_all_jobs,
         adapt_cv=request.adapt_cv,
         generate_cover_letter=request.generate_cover_letter,
         start_application=request.start_application,
@@ -14,6 +14,7 @@ from src.agents.cv_adapter import (
     CVAdapterInput,
 )
 from src.api.dependencies import ClaudeDep, DbDep
+from src.api.io_policy import io_bound
 from src.api.schemas import (
     CVAdaptRequest,
     CVAdaptResponse,
@@ -30,6 +31,9 @@ from src.db.repositories.material import MaterialRepository
 
 router = APIRouter()
 
+# Chunk size used when streaming generated documents to the client
+DOCUMENT_CHUNK_SIZE = 64 * 1024
+
 
 # ============================================================================
 # Job Import Schema
@@ -682,7 +686,7 @@ async def generate_document(request: DocumentGenerateRequest):
     2. Generates a formatted document in the requested format
     3. Returns the document as a downloadable file
     """
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
 
     from src.services.document_generator import (
         DocumentFormat,
@@ -718,7 +722,11 @@ async def generate_document(request: DocumentGenerateRequest):
 
     # Generate document
     generator = DocumentGenerator()
-    doc_bytes = generator.generate(request.content, doc_format, doc_type, metadata)
+    # python-docx/fpdf2 rendering is blocking CPU work; keep it off the event loop
+    buffer = await io_bound(generator.generate_stream)(
+        request.content, doc_format, doc_type, metadata
+    )
+    size = buffer.getbuffer().nbytes
 
     # Set content type and filename
     if doc_format == DocumentFormat.DOCX:
@@ -733,8 +741,12 @@ async def generate_document(request: DocumentGenerateRequest):
     company_slug = request.company.replace(" ", "_") if request.company else "document"
     filename = f"{type_name}_{company_slug}.{ext}"
 
-    return Response(
-        content=doc_bytes,
+    # Read the buffer in chunks rather than copying it into a single body
+    return StreamingResponse(
+        iter(lambda: buffer.read(DOCUMENT_CHUNK_SIZE), b""),
         media_type=content_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
     )
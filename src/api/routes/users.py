@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm.attributes import flag_modified
 
 from src.api.dependencies import ClaudeDep, DbDep
+from src.api.io_policy import io_bound
 from src.api.schemas import (
     EmailSender,
     EmailSenderPreferences,
@@ -100,6 +101,7 @@ class SavedAnswersResponse(BaseModel):
 # ============================================================================
 
 
+@io_bound
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from a PDF file."""
     from pypdf import PdfReader
@@ -115,6 +117,7 @@ def extract_text_from_pdf(file_content: bytes) -> str:
     return "\n\n".join(text_parts)
 
 
+@io_bound
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from a DOCX file."""
     from docx import Document
@@ -220,9 +223,9 @@ async def upload_cv(
     # Extract text based on file type
     try:
         if file_type == "pdf":
-            text = extract_text_from_pdf(content)
+            text = await extract_text_from_pdf(content)
         elif file_type == "docx":
-            text = extract_text_from_docx(content)
+            text = await extract_text_from_docx(content)
         else:  # txt
             text = content.decode("utf-8", errors="replace")
     except Exception as e:
@@ -14,6 +14,7 @@ import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field
 
@@ -87,6 +88,10 @@ class ApplicationPipeline:
         "temporary",
     ]
 
+    # Job sites matched on the URL host or any parent domain ("uk.linkedin.com")
+    LINKEDIN_DOMAINS = frozenset({"linkedin.com"})
+    MANUAL_LOGIN_DOMAINS = frozenset({"indeed.com"})
+
     def __init__(
         self,
         api_url: str = "http://localhost:8000",
@@ -363,22 +368,17 @@ class ApplicationPipeline:
 
     def _should_skip_job(self, url: str) -> bool:
         """Check if job URL should be skipped."""
-        url_lower = url.lower()
+        # source_url is unvalidated, so "www.linkedin.com/jobs/..." must work too
+        host = urlparse(url).hostname or urlparse(f"//{url}").hostname or ""
+        parts = host.rstrip(".").split(".")
+        domains = {".".join(parts[i:]) for i in range(len(parts) - 1)}
 
         # LinkedIn jobs - only skip if user doesn't have LinkedIn connected
-        if "linkedin.com" in url_lower:
-            if self._has_linkedin_session:
-                # User has LinkedIn OAuth, we can try to apply
-                return False
-            else:
-                # No LinkedIn connection, skip
-                return True
+        if not domains.isdisjoint(self.LINKEDIN_DOMAINS):
+            return not self._has_linkedin_session
 
         # Indeed still requires manual login - always skip
-        if "indeed.com" in url_lower:
-            return True
-
-        return False
+        return not domains.isdisjoint(self.MANUAL_LOGIN_DOMAINS)
 
     async def _update_job_status(self, client, job_id: str, attempt: ApplicationAttempt):
         """Update job status based on application result."""
@@ -35,6 +35,7 @@ from src.browser_service.models import (
     UploadRequest,
     WaitRequest,
 )
+from src.config import settings
 from src.mcp.chrome_client import ChromeDevToolsMCP
 
 logger = logging.getLogger(__name__)
@@ -94,12 +95,15 @@ class ChromeDevToolsAdapter(BrowserAdapter):
             logger.info(f"Using Chrome DevTools at port {port} (from {config.devtools_url})")
 
         # Create and connect MCP client
-        self._mcp_client = ChromeDevToolsMCP(port=port)
+        self._mcp_client = ChromeDevToolsMCP(port=port, url=settings.chrome_mcp_url)
         await self._mcp_client.__aenter__()
 
-        # List available tools for debugging
-        tools = await self._mcp_client.list_available_tools()
-        logger.info(f"Chrome DevTools MCP initialized with tools: {tools}")
+        # Listing tools costs an extra round-trip, so it's opt-in for debugging
+        if settings.chrome_mcp_list_tools:
+            tools = await self._mcp_client.list_available_tools()
+            logger.info(f"Chrome DevTools MCP initialized with tools: {tools}")
+        else:
+            logger.info("Chrome DevTools MCP initialized")
 
     async def close(self) -> None:
         """Close MCP connection."""
@@ -317,9 +321,10 @@ class ChromeDevToolsAdapter(BrowserAdapter):
             await self.mcp.navigate(request.url)
             duration = int((time.time() - start) * 1000)
 
-            # Update cached URL/title
-            self._current_url = await self.mcp.get_current_url()
-            self._current_title = await self.mcp.get_page_title()
+            # Update cached URL/title (single round-trip)
+            page = await self.mcp.snapshot_page(include_html=False)
+            self._current_url = page.get("url", "")
+            self._current_title = page.get("title", "")
 
             return NavigateResponse(
                 success=True,
@@ -622,10 +627,14 @@ class ChromeDevToolsAdapter(BrowserAdapter):
                     )
 
             logger.info(f"DOM found {len(form_fields)} form fields")
+            if not self._current_url or not self._current_title:
+                page = await self.mcp.snapshot_page(include_html=False)
+                self._current_url = self._current_url or page.get("url", "")
+                self._current_title = self._current_title or page.get("title", "")
             return DOMResponse(
                 success=True,
-                page_url=self._current_url or await self.mcp.get_current_url(),
-                page_title=self._current_title or await self.mcp.get_page_title(),
+                page_url=self._current_url,
+                page_title=self._current_title,
                 form_fields=form_fields,
                 html_snippet=self._cached_snapshot[:5000],
             )
@@ -103,6 +103,12 @@ class Settings(BaseSettings):
     browser_service_url: str = "http://localhost:8001"
     browser_service_timeout: int = Field(default=30000, ge=5000, le=120000)  # ms
     default_browser_mode: str = "chrome-devtools"  # "chrome-devtools" or "playwright"
+    # Streamable HTTP URL of a shared chrome-devtools MCP server; unset spawns one over stdio
+    chrome_mcp_url: str | None = None
+    chrome_mcp_list_tools: bool = False  # Fetch and log MCP tools on connect (debugging)
+
+    # Scraping
+    html_parser: str = "lxml"  # BeautifulSoup parser; "html.parser" as fallback for odd markup
 
     # Playwright Settings
     playwright_headless: bool = True
@@ -11,6 +11,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -217,6 +218,7 @@ class Job(Base):
     """Job opportunity in the pipeline."""
 
     __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_user_id_source_url", "user_id", "source_url"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -2,6 +2,7 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from html.parser import HTMLParser
 from urllib.parse import parse_qs, unquote, urlparse
 
@@ -256,90 +257,86 @@ class JobLinkExtractor(HTMLParser):
         return url
 
 
-def detect_platform(url: str, sender: str = "") -> str:
-    """Detect the job platform from URL or sender."""
-    url_lower = url.lower()
-    sender_lower = sender.lower()
-
+# (platform, URL substrings, sender substrings), in priority order: the first
+# platform matching either the URL or the sender wins.
+_PLATFORM_RULES: tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...] = (
     # Major international platforms
-    if "linkedin.com" in url_lower or "linkedin" in sender_lower:
-        return "linkedin"
-    if "indeed.com" in url_lower or "indeed" in sender_lower:
-        return "indeed"
-    if "glassdoor.com" in url_lower or "glassdoor" in sender_lower:
-        return "glassdoor"
-    if "monster.com" in url_lower or "monster" in sender_lower:
-        return "monster"
-    if "careerbuilder.com" in url_lower or "careerbuilder" in sender_lower:
-        return "careerbuilder"
-    if "ziprecruiter.com" in url_lower or "ziprecruiter" in sender_lower:
-        return "ziprecruiter"
-    if "dice.com" in url_lower or "dice" in sender_lower:
-        return "dice"
-
+    ("linkedin", ("linkedin.com",), ("linkedin",)),
+    ("indeed", ("indeed.com",), ("indeed",)),
+    ("glassdoor", ("glassdoor.com",), ("glassdoor",)),
+    ("monster", ("monster.com",), ("monster",)),
+    ("careerbuilder", ("careerbuilder.com",), ("careerbuilder",)),
+    ("ziprecruiter", ("ziprecruiter.com",), ("ziprecruiter",)),
+    ("dice", ("dice.com",), ("dice",)),
     # ATS platforms
-    if "greenhouse.io" in url_lower or "boards.greenhouse" in url_lower:
-        return "greenhouse"
-    if "lever.co" in url_lower or "jobs.lever" in url_lower:
-        return "lever"
-    if "workable.com" in url_lower:
-        return "workable"
-    if "smartrecruiters.com" in url_lower:
-        return "smartrecruiters"
-    if "myworkdayjobs.com" in url_lower:
-        return "workday"
-    if "breezy.hr" in url_lower:
-        return "breezy"
-    if "jobvite.com" in url_lower:
-        return "jobvite"
-    if "icims.com" in url_lower:
-        return "icims"
-    if "bamboohr.com" in url_lower:
-        return "bamboohr"
-    if "recruitee.com" in url_lower:
-        return "recruitee"
-    if "ashbyhq.com" in url_lower:
-        return "ashby"
-
+    ("greenhouse", ("greenhouse.io", "boards.greenhouse"), ()),
+    ("lever", ("lever.co", "jobs.lever"), ()),
+    ("workable", ("workable.com",), ()),
+    ("smartrecruiters", ("smartrecruiters.com",), ()),
+    ("workday", ("myworkdayjobs.com",), ()),
+    ("breezy", ("breezy.hr",), ()),
+    ("jobvite", ("jobvite.com",), ()),
+    ("icims", ("icims.com",), ()),
+    ("bamboohr", ("bamboohr.com",), ()),
+    ("recruitee", ("recruitee.com",), ()),
+    ("ashby", ("ashbyhq.com",), ()),
     # Tech/Startup platforms
-    if "wellfound.com" in url_lower or "angel.co" in url_lower:
-        return "wellfound"
-    if "stackoverflow.com/jobs" in url_lower:
-        return "stackoverflow"
-    if "weworkremotely.com" in url_lower:
-        return "weworkremotely"
-    if "remoteok.io" in url_lower:
-        return "remoteok"
-    if "remote.co" in url_lower:
-        return "remoteco"
-    if "flexjobs.com" in url_lower:
-        return "flexjobs"
-    if "getmanfred.com" in url_lower or "manfred" in sender_lower:
-        return "manfred"
-
+    ("wellfound", ("wellfound.com", "angel.co"), ()),
+    ("stackoverflow", ("stackoverflow.com/jobs",), ()),
+    ("weworkremotely", ("weworkremotely.com",), ()),
+    ("remoteok", ("remoteok.io",), ()),
+    ("remoteco", ("remote.co",), ()),
+    ("flexjobs", ("flexjobs.com",), ()),
+    ("manfred", ("getmanfred.com",), ("manfred",)),
     # Spanish-speaking platforms
-    if "infojobs.net" in url_lower or "infojobs" in sender_lower:
-        return "infojobs"
-    if "computrabajo.com" in url_lower or "computrabajo" in sender_lower:
-        return "computrabajo"
-    if "bumeran.com" in url_lower or "bumeran" in sender_lower:
-        return "bumeran"
-    if "trabajando.com" in url_lower:
-        return "trabajando"
-    if "occ.com.mx" in url_lower:
-        return "occ"
-    if "empleosit.com" in url_lower:
-        return "empleosit"
-    if "tecnoempleo.com" in url_lower or "tecnoempleo" in sender_lower:
-        return "tecnoempleo"
-    if "getontop.com" in url_lower:
-        return "getontop"
-
+    ("infojobs", ("infojobs.net",), ("infojobs",)),
+    ("computrabajo", ("computrabajo.com",), ("computrabajo",)),
+    ("bumeran", ("bumeran.com",), ("bumeran",)),
+    ("trabajando", ("trabajando.com",), ()),
+    ("occ", ("occ.com.mx",), ()),
+    ("empleosit", ("empleosit.com",), ()),
+    ("tecnoempleo", ("tecnoempleo.com",), ("tecnoempleo",)),
+    ("getontop", ("getontop.com",), ()),
     # Special senders
-    if "jackandjillemployment" in sender_lower or "jack&jill" in sender_lower:
-        return "jack_and_jill"
+    ("jack_and_jill", (), ("jackandjillemployment", "jack&jill")),
+)
+
+# URL substrings in priority order, so a URL is ranked with plain `in` checks
+_URL_NEEDLE_PLATFORMS = {
+    needle: platform for platform, needles, _ in _PLATFORM_RULES for needle in needles
+}
+_URL_NEEDLES = tuple(_URL_NEEDLE_PLATFORMS)
+
+_FALLBACK_JOB_URL_RE = re.compile(
+    r'https?://[^\s<>"\']+(?:job|career|position|vacancy|empleo)[^\s<>"\']*', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _sender_platform_scan(sender: str) -> tuple[tuple[str, ...], str]:
+    """Return the sender's platform and the URL substrings that outrank it.
+
+    Ranked once per sender; every link in an email shares the same sender.
+    """
+    sender_lower = sender.lower()
+    outranking = 0
+    for platform, url_needles, sender_needles in _PLATFORM_RULES:
+        if any(needle in sender_lower for needle in sender_needles):
+            return _URL_NEEDLES[:outranking], platform
+        outranking += len(url_needles)
+    return _URL_NEEDLES, "other"
+
+
+def detect_platform(url: str, sender: str = "") -> str:
+    """Detect the job platform from URL or sender."""
+    url_lower = url.lower()
+    needles, sender_platform = _sender_platform_scan(sender)
+
+    for needle in needles:
+        if needle in url_lower:
+            return _URL_NEEDLE_PLATFORMS[needle]
 
-    return "other"
+    return sender_platform
 
 
 def extract_job_info_from_text(
@@ -500,8 +497,7 @@ def parse_job_email(body: str, sender: str = "", subject: str = "") -> list[Extr
     # If no links found via HTML parsing, try regex extraction
     if not jobs:
         # Extract URLs with regex
-        url_pattern = r'https?://[^\s<>"\']+(?:job|career|position|vacancy|empleo)[^\s<>"\']*'
-        urls = re.findall(url_pattern, body, re.IGNORECASE)
+        urls = _FALLBACK_JOB_URL_RE.findall(body)
 
         for url in urls[:10]:  # Limit to first 10
             if url in seen_urls:
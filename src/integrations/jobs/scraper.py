@@ -11,7 +11,7 @@ from html.parser import HTMLParser
 
 import httpx
 
-from src.scraper.ai_extractor import AIExtractedJob, GeminiExtractor
+from src.scraper.ai_extractor import AIExtractedJob, get_gemini_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -468,7 +468,7 @@ async def scrape_job_url(url: str, timeout: float = 30.0) -> ScrapedJob:
         # Primary: Try AI extraction with Gemini
         try:
             logger.info(f"Attempting AI extraction for {url}")
-            extractor = GeminiExtractor()
+            extractor = get_gemini_extractor()
             ai_job = await extractor.extract(html, url)
             job = _map_ai_extracted_to_scraped_job(ai_job, platform)
             logger.info(f"AI extraction successful for {url}")
@@ -1,12 +1,20 @@
 """FastAPI application entry point."""
 
+import asyncio
+import multiprocessing
+import os
 from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.config import settings
+from src.middleware import CacheMiddleware
+from src.scraper.ai_extractor import get_gemini_extractor
+from src.scraper.content_cleaner import set_cpu_pool
 
 # Try to import langfuse tracing, but make it optional
 try:
@@ -32,8 +40,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     if LANGFUSE_AVAILABLE:
         init_langfuse()
+    # Process pool for CPU-bound HTML cleaning during job extraction.
+    # "spawn" avoids forking a process that already runs the event loop's threads.
+    app.state.cpu_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    )
+    set_cpu_pool(app.state.cpu_pool)
+    # Build the Gemini client and its connection in the background so the
+    # first job extraction doesn't pay for it (and startup doesn't wait on it)
+    warm_up = asyncio.create_task(get_gemini_extractor().warm_up())
     yield
     # Shutdown
+    warm_up.cancel()
+    set_cpu_pool(None)
+    app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
     if LANGFUSE_AVAILABLE:
         flush_langfuse()
         shutdown_langfuse()
@@ -44,6 +64,7 @@ app = FastAPI(
     description="AI-powered job hunting automation",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Global exception handler to log unhandled errors
@@ -70,6 +91,10 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # CORS middleware
 # Note: For WebSocket connections, explicit origins are needed when allow_credentials=True
+# Starlette's CORSMiddleware is pure ASGI and builds its response headers once at
+# startup. Any middleware added here (request IDs, timing, etc.) must also be a
+# pure ASGI callable: BaseHTTPMiddleware / @app.middleware("http") buffer
+# responses, break streaming and add latency under load.
 _dev_origins = [
     "http://localhost:3000",
     "http://localhost:3001",
@@ -80,6 +105,11 @@ _dev_origins = [
 ]
 # Production uses FRONTEND_URL env var (set in Render dashboard)
 _prod_origins = [settings.frontend_url] if settings.frontend_url else []
+# Added before CORS so CORS stays outermost and decorates cached replies too.
+# Gmail scans and email ingestion insert jobs, so their writes clear the cache as well.
+app.add_middleware(
+    CacheMiddleware, invalidate_prefixes=("/api/jobs", "/api/gmail", "/api/emails")
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_dev_origins if settings.is_development else _prod_origins,
@@ -89,23 +119,42 @@ app.add_middleware(
 )
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+# Root and health checks are hit constantly by load balancers, so they are
+# plain Starlette routes returning pre-serialized bodies (no dependency
+# resolution or response-model serialization per request).
+import json
+
+from starlette.responses import Response
+from starlette.routing import Route
+
+_ROOT_BYTES = json.dumps(
+    {
         "name": "Job Hunter API",
         "version": "0.1.0",
         "status": "running",
     }
+).encode()
 
-
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {
+_HEALTH_BYTES = json.dumps(
+    {
         "status": "ok",
         "environment": settings.app_env.value,
     }
+).encode()
+
+
+async def root(request: Request) -> Response:
+    """Root endpoint."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+async def health(request: Request) -> Response:
+    """Health check endpoint."""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+app.router.routes.insert(0, Route("/health", endpoint=health, methods=["GET"]))
+app.router.routes.insert(0, Route("/", endpoint=root, methods=["GET"]))
 
 
 # Test WebSocket endpoint (for debugging 403 issue)
@@ -135,3 +184,8 @@ app.include_router(applications.router, prefix="/api/applications", tags=["appli
 app.include_router(gmail.router, prefix="/api/gmail", tags=["gmail"])
 app.include_router(emails.router, prefix="/api/emails", tags=["emails"])
 app.include_router(linkedin.router, prefix="/api/linkedin", tags=["linkedin"])
+
+# Refuse to start if a handler breaks the sync/async I/O policy
+from src.api.io_policy import check_route_io_policy
+
+check_route_io_policy(app.router.routes)
@@ -22,20 +22,44 @@ Usage:
 
 import asyncio
 import logging
+import re
 from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
+
 from mcp import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
 
+# evaluate_script wraps its return value in a ```json fenced block
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
+# Snapshot lines look like: uid=1_2 button "Submit"
+_SNAPSHOT_UID_RE = re.compile(r'uid=(\d+_\d+)\s+(\w+)(?:\s+"([^"]*)")?')
+
+# DOM identity check deciding whether cached snapshot uids still apply. With
+# stamp=true every element is tagged with the snapshot epoch; otherwise null is
+# returned if any element lacks the tag, so a re-render that swaps in new nodes
+# is caught even when the element count is unchanged. Nodes replaced between the
+# snapshot and the first stamp go unnoticed.
+_DOM_FINGERPRINT_SCRIPT = (
+    "() => {{ const els = document.getElementsByTagName('*');"
+    " for (const el of els) {{"
+    " if ({stamp}) el.__jobHunterSnapshot = {epoch};"
+    " else if (el.__jobHunterSnapshot !== {epoch}) return null; }}"
+    " return window.location.href + '|' + els.length; }}"
+)
+
 
 class ChromeDevToolsMCP:
     """MCP client for Chrome DevTools browser automation.
 
-    Connects to chrome-devtools-mcp server via stdio
-    and provides browser automation capabilities.
+    Connects to chrome-devtools-mcp server via stdio (or, when ``url`` is set,
+    to a long-lived server over streamable HTTP) and provides browser
+    automation capabilities.
 
     Requirements:
         - Node.js 22 or above
@@ -51,6 +75,7 @@ class ChromeDevToolsMCP:
         args: list[str] | None = None,
         cwd: str | None = None,
         port: int | None = None,
+        url: str | None = None,
     ) -> None:
         """Initialize Chrome DevTools MCP client.
 
@@ -59,6 +84,9 @@ class ChromeDevToolsMCP:
             args: Arguments for command (default: [chrome-devtools-mcp@latest])
             cwd: Working directory for server process
             port: Chrome DevTools debugging port (default: 9222)
+            url: Streamable HTTP endpoint of an already running MCP server
+                (e.g. "http://chrome-mcp:9333/mcp"). When set, no server
+                process is spawned and the stdio options are ignored.
         """
         default_args = ["chrome-devtools-mcp@latest", "--isolated"]
         if port:
@@ -69,17 +97,27 @@ class ChromeDevToolsMCP:
             args=args or default_args,
             cwd=cwd,
         )
+        self.url = url
         self._session: ClientSession | None = None
         self._context_manager: Any = None
         self._tools: dict[str, Any] = {}
+        # (role, accessible name) -> uid from the latest take_snapshot
+        self._snapshot_cache: dict[tuple[str, str], str] = {}
+        self._snapshot_epoch: int = 0
+        self._snapshot_fingerprint: str | None = None
+        self._snapshot_dirty: bool = False
 
     async def __aenter__(self) -> "ChromeDevToolsMCP":
         """Start MCP server and establish connection."""
         logger.info("Starting Chrome DevTools MCP server...")
 
-        # Create stdio client context
-        self._context_manager = stdio_client(self.server_params)
-        read_stream, write_stream = await self._context_manager.__aenter__()
+        # Create transport context: HTTP reuses a shared server, stdio spawns one
+        if self.url:
+            self._context_manager = streamablehttp_client(self.url)
+        else:
+            self._context_manager = stdio_client(self.server_params)
+        # streamablehttp_client also yields a session-id getter; only the streams matter
+        read_stream, write_stream, *_ = await self._context_manager.__aenter__()
 
         # Create and initialize session
         self._session = ClientSession(read_stream, write_stream)
@@ -90,10 +128,9 @@ class ChromeDevToolsMCP:
         server_info = getattr(result, "serverInfo", getattr(result, "server_info", None))
         logger.info(f"MCP session initialized: {server_info}")
 
-        # Cache available tools
-        tools_result = await self._session.list_tools()
-        self._tools = {tool.name: tool for tool in tools_result.tools}
-        logger.info(f"Available browser tools: {list(self._tools.keys())}")
+        # Tools are called by name, so the tool list is only fetched on demand
+        # (list_available_tools) rather than on every connection
+        self._tools = {}
 
         return self
 
@@ -177,6 +214,7 @@ class ChromeDevToolsMCP:
             Navigation result
         """
         result = await self.call_tool("navigate_page", {"url": url})
+        self._invalidate_snapshot_cache()
         return self._parse_result(result)
 
     async def new_page(self, url: str | None = None) -> dict[str, Any]:
@@ -190,6 +228,7 @@ class ChromeDevToolsMCP:
         """
         args = {"url": url} if url else {}
         result = await self.call_tool("new_page", args)
+        self._invalidate_snapshot_cache()
         return self._parse_result(result)
 
     async def list_pages(self) -> dict[str, Any]:
@@ -211,6 +250,7 @@ class ChromeDevToolsMCP:
             Selection result
         """
         result = await self.call_tool("select_page", {"pageId": page_id})
+        self._invalidate_snapshot_cache()
         return self._parse_result(result)
 
     async def close_page(self, page_id: str | None = None) -> dict[str, Any]:
@@ -224,6 +264,7 @@ class ChromeDevToolsMCP:
         """
         args = {"pageId": page_id} if page_id else {}
         result = await self.call_tool("close_page", args)
+        self._invalidate_snapshot_cache()
         return self._parse_result(result)
 
     async def wait_for(
@@ -267,6 +308,7 @@ class ChromeDevToolsMCP:
                 "value": value,
             },
         )
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def fill_form(self, fields: list[dict[str, str]]) -> dict[str, Any]:
@@ -279,6 +321,7 @@ class ChromeDevToolsMCP:
             Fill result
         """
         result = await self.call_tool("fill_form", {"fields": fields})
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def click(self, uid: str) -> dict[str, Any]:
@@ -291,8 +334,33 @@ class ChromeDevToolsMCP:
             Click result
         """
         result = await self.call_tool("click", {"uid": uid})
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
+    async def click_by_role(self, role: str, name: str) -> dict[str, Any]:
+        """Click an element identified by its accessibility role and name.
+
+        Reuses the uid from the last snapshot when the page hasn't changed
+        since, and only takes a new snapshot otherwise.
+
+        Args:
+            role: Accessibility role (e.g. "button", "link")
+            name: Accessible name (e.g. "Apply")
+
+        Returns:
+            Click result
+
+        Raises:
+            ValueError: If no matching element is in a fresh snapshot
+        """
+        uid = await self._cached_uid(role, name)
+        if uid is None:
+            await self.take_snapshot()
+            uid = self._snapshot_cache.get((role, name))
+            if uid is None:
+                raise ValueError(f"No {role} named {name!r} in page snapshot")
+        return await self.click(uid)
+
     async def hover(self, uid: str) -> dict[str, Any]:
         """Hover over an element.
 
@@ -303,6 +371,7 @@ class ChromeDevToolsMCP:
             Hover result
         """
         result = await self.call_tool("hover", {"uid": uid})
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def drag(self, source_uid: str, target_uid: str) -> dict[str, Any]:
@@ -322,6 +391,7 @@ class ChromeDevToolsMCP:
                 "targetUid": target_uid,
             },
         )
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def upload_file(self, uid: str, file_path: str) -> dict[str, Any]:
@@ -341,6 +411,7 @@ class ChromeDevToolsMCP:
                 "filePath": file_path,
             },
         )
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def press_key(self, key: str, uid: str | None = None) -> dict[str, Any]:
@@ -357,6 +428,7 @@ class ChromeDevToolsMCP:
         if uid:
             args["uid"] = uid
         result = await self.call_tool("press_key", args)
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def handle_dialog(self, accept: bool, prompt_text: str | None = None) -> dict[str, Any]:
@@ -373,6 +445,7 @@ class ChromeDevToolsMCP:
         if prompt_text is not None:
             args["promptText"] = prompt_text
         result = await self.call_tool("handle_dialog", args)
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     # =========================================================================
@@ -390,6 +463,7 @@ class ChromeDevToolsMCP:
         """
         # MCP tool expects "function" argument, not "script"
         result = await self.call_tool("evaluate_script", {"function": script})
+        self._snapshot_dirty = True
         return self._parse_result(result)
 
     async def screenshot(self, full_page: bool = False) -> dict[str, Any]:
@@ -411,7 +485,19 @@ class ChromeDevToolsMCP:
             Snapshot result
         """
         result = await self.call_tool("take_snapshot", {})
-        return self._parse_result(result)
+        parsed = self._parse_result(result)
+
+        text = parsed.get("text", "") if isinstance(parsed, dict) else ""
+        self._snapshot_cache = {
+            (role, elem_name): uid
+            for uid, role, elem_name in _SNAPSHOT_UID_RE.findall(text)
+            if elem_name
+        }
+        self._snapshot_epoch += 1
+        self._snapshot_dirty = False
+        # Taken lazily by the first cached lookup, so plain snapshots cost no extra call
+        self._snapshot_fingerprint = None
+        return parsed
 
     async def list_console_messages(self) -> dict[str, Any]:
         """List console messages.
@@ -481,6 +567,71 @@ class ChromeDevToolsMCP:
         result = await self.evaluate("() => document.title")
         return self._extract_json_value(result)
 
+    async def snapshot_page(self, include_html: bool = True) -> dict[str, Any]:
+        """Get page HTML, URL and title in a single evaluate call.
+
+        Saves two MCP round-trips compared to calling get_content(),
+        get_current_url() and get_page_title() separately.
+
+        Args:
+            include_html: Whether to include the full page HTML
+
+        Returns:
+            Dict with "url", "title" and (optionally) "html" keys
+        """
+        html_field = "html: document.documentElement.outerHTML, " if include_html else ""
+        result = await self.evaluate(
+            f"() => ({{{html_field}url: window.location.href, title: document.title}})"
+        )
+        value = self._extract_json_value(result)
+        if not isinstance(value, dict):
+            raise RuntimeError(f"Unexpected snapshot_page result: {value!r}")
+        return value
+
+    async def _dom_fingerprint(self, stamp: bool = False) -> str:
+        """Return a fingerprint of the current document for the snapshot epoch.
+
+        Args:
+            stamp: Tag the current elements with the epoch instead of checking them
+        """
+        script = _DOM_FINGERPRINT_SCRIPT.format(
+            stamp="true" if stamp else "false", epoch=self._snapshot_epoch
+        )
+        # Not via evaluate(), which marks the page dirty
+        result = await self.call_tool("evaluate_script", {"function": script})
+        return str(self._extract_json_value(self._parse_result(result)))
+
+    def _invalidate_snapshot_cache(self) -> None:
+        """Drop cached snapshot uids (e.g. after navigating or switching pages)."""
+        self._snapshot_cache = {}
+        self._snapshot_fingerprint = None
+        self._snapshot_dirty = False
+
+    async def _cached_uid(self, role: str, name: str) -> str | None:
+        """Look up a uid from the last snapshot if it is still valid.
+
+        The first lookup after a snapshot stamps the DOM; if any tool that can
+        change the page ran in between, the snapshot is retaken instead. After
+        such a tool the cache is only trusted again once the fingerprint still
+        matches. Changes the page makes on its own between the snapshot and the
+        first lookup are not detected.
+        """
+        uid = self._snapshot_cache.get((role, name))
+        if uid is None:
+            return None
+        if self._snapshot_fingerprint is None:
+            if self._snapshot_dirty:
+                # The page may have changed before it was ever stamped
+                self._invalidate_snapshot_cache()
+                return None
+            self._snapshot_fingerprint = await self._dom_fingerprint(stamp=True)
+        elif self._snapshot_dirty:
+            if await self._dom_fingerprint() != self._snapshot_fingerprint:
+                self._invalidate_snapshot_cache()
+                return None
+            self._snapshot_dirty = False
+        return uid
+
     def _extract_json_value(self, result: Any) -> str:
         """Extract JSON value from MCP markdown response.
 
@@ -499,30 +650,30 @@ class ChromeDevToolsMCP:
         Returns:
             Extracted string value
         """
-        import json
-        import re
-
         if isinstance(result, dict):
             text = result.get("text", "")
         else:
             text = str(result) if result else ""
 
         # Try to extract JSON from markdown code block
-        match = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL)
+        match = _JSON_FENCE_RE.search(text)
         if match:
             try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
+                return orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
                 return match.group(1).strip('"')
 
         return text
 
     async def list_available_tools(self) -> list[str]:
-        """List all available MCP tools.
+        """List all available MCP tools, fetching them on first use.
 
         Returns:
             List of tool names
         """
+        if not self._tools:
+            tools_result = await self.session.list_tools()
+            self._tools = {tool.name: tool for tool in tools_result.tools}
         return list(self._tools.keys())
 
     def _parse_result(self, result: Any) -> dict[str, Any]:
@@ -541,11 +692,9 @@ class ChromeDevToolsMCP:
                 first = content[0]
                 if hasattr(first, "text"):
                     # Try to parse as JSON
-                    import json
-
                     try:
-                        return json.loads(first.text)
-                    except json.JSONDecodeError:
+                        return orjson.loads(first.text)
+                    except orjson.JSONDecodeError:
                         return {"text": first.text}
                 elif hasattr(first, "data"):
                     return {"data": first.data}
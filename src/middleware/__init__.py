@@ -0,0 +1,5 @@
+"""Pure ASGI middleware for the API."""
+
+from src.middleware.cache import CacheMiddleware
+
+__all__ = ["CacheMiddleware"]
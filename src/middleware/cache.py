@@ -0,0 +1,100 @@
+"""Short-lived response cache for read-heavy GET endpoints.
+
+Pure ASGI (see the middleware note in src/main.py): successful GET responses
+under the configured path prefixes are kept in a small TTL cache and replayed
+without touching the route, the database or response serialization.
+"""
+
+from cachetools import TTLCache
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CacheKey = tuple[str, bytes, bytes]
+CachedResponse = tuple[int, list[tuple[bytes, bytes]], bytes]
+
+
+class CacheMiddleware:
+    """Cache successful GET responses for a few seconds.
+
+    Entries are keyed by path, query string and the Authorization header, so
+    a cached response is only ever replayed to the same credentials. Any
+    non-GET request under an invalidating prefix clears the cache when it
+    starts and again when it finishes, and a GET that was in flight across
+    either clear is not stored. Writes that bypass those prefixes (background
+    jobs, the CLI) show up once the entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: tuple[str, ...] = ("/api/jobs",),
+        invalidate_prefixes: tuple[str, ...] | None = None,
+        ttl: float = 5.0,
+        maxsize: int = 1024,
+    ) -> None:
+        self.app = app
+        self.path_prefixes = path_prefixes
+        # Everything that can change a cached response, e.g. routes creating jobs
+        self.invalidate_prefixes = invalidate_prefixes or path_prefixes
+        self._cache: TTLCache[CacheKey, CachedResponse] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._epoch = 0
+
+    def _clear(self) -> None:
+        """Drop all entries and invalidate responses still being produced."""
+        self._cache.clear()
+        self._epoch += 1
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if scope["method"] != "GET":
+            if not path.startswith(self.invalidate_prefixes):
+                await self.app(scope, receive, send)
+                return
+            self._clear()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self._clear()
+            return
+
+        if not path.startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+        key: CacheKey = (path, scope["query_string"], authorization)
+        epoch = self._epoch
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            cached_status, cached_headers, body = cached
+            await send(
+                {"type": "http.response.start", "status": cached_status, "headers": cached_headers}
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        status = 0
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and status == 200:
+                chunks.append(message.get("body", b""))
+                # Skip responses that may have read data from before a write
+                if not message.get("more_body", False) and epoch == self._epoch:
+                    self._cache[key] = (status, headers, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
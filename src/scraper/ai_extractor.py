@@ -3,20 +3,28 @@
 Uses function calling for guaranteed structured JSON output.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import aclosing
 from dataclasses import dataclass
+from typing import Any, cast
 
+import httpx
+import orjson
 from google import genai
 from google.genai import types
 
 from src.config import settings
-from src.scraper.content_cleaner import clean_html_for_extraction
+from src.scraper.content_cleaner import clean_html_async
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AIExtractedJob:
     """AI-extracted job data."""
 
@@ -33,6 +41,36 @@ class AIExtractedJob:
     model_used: str | None = None
 
 
+# Fields the model fills in, in schema order
+_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "description",
+    "salary_range",
+    "job_type",
+    "requirements",
+    "remote_type",
+    "easy_apply",
+    "employment_type",
+)
+
+
+def _job_from_mapping(data: Mapping[str, Any]) -> AIExtractedJob:
+    """Build an AIExtractedJob from model output in a single pass over _FIELDS.
+
+    Reads the mapping as is (no intermediate dict copy) and coerces
+    ``requirements`` to ``list[str]``.
+    """
+    values = {f: data.get(f) for f in _FIELDS}
+    requirements = values["requirements"]
+    if isinstance(requirements, str):
+        values["requirements"] = [requirements]
+    elif requirements is not None:
+        values["requirements"] = [str(r) for r in requirements]
+    return AIExtractedJob(**values)
+
+
 # Model priority list - Best quality first, with fallbacks for availability
 GEMINI_MODELS = [
     "gemini-3-flash-preview",  # Best quality, 3x faster than 2.5 Pro (free tier: 5k/month)
@@ -41,6 +79,9 @@ GEMINI_MODELS = [
     "gemini-2.0-flash",  # Stable fallback
 ]
 
+# Number of top models from GEMINI_MODELS that are raced concurrently
+HEDGED_MODEL_COUNT = 2
+
 # Function declaration for structured output via tool calling
 EXTRACT_JOB_FUNCTION = types.FunctionDeclaration(
     name="extract_job_data",
@@ -105,6 +146,68 @@ EXTRACT_JOB_FUNCTION = types.FunctionDeclaration(
     ),
 )
 
+# Request configs are built once; constructing them validates the nested schema
+_FUNCCALL_CONFIG = types.GenerateContentConfig(
+    temperature=0.1,
+    max_output_tokens=4096,
+    tools=[types.Tool(function_declarations=[EXTRACT_JOB_FUNCTION])],
+    tool_config=types.ToolConfig(
+        function_calling_config=types.FunctionCallingConfig(
+            mode="ANY",
+        )
+    ),
+)
+_TEXT_CONFIG = types.GenerateContentConfig(
+    temperature=0.1,
+    max_output_tokens=4096,
+)
+
+# Shared connection pool for the Gemini client, so concurrent extractions
+# reuse keep-alive TLS connections instead of handshaking per request
+_HTTP_OPTIONS = types.HttpOptions(
+    timeout=60000,  # ms
+    async_client_args={
+        "limits": httpx.Limits(
+            max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+        ),
+    },
+)
+
+# Captures the body of a response wrapped in a ``` / ```json fence
+_MD_CODE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+# Cleaned-content cache, keyed by a digest of the raw HTML so retries and
+# re-extractions of the same page skip the cleaning pass without keeping
+# whole pages in memory.
+_CLEAN_CACHE_SIZE = 256
+_clean_cache: OrderedDict[tuple[bytes, int], str] = OrderedDict()
+
+
+async def _clean_cached(html_content: str, max_length: int) -> str:
+    """Clean HTML for extraction, reusing the result for previously seen content."""
+    # Already-simplified input (text/markdown rather than a full page) is used as is
+    if len(html_content) < max_length:
+        head = html_content[:4096].lower()
+        if "<html" not in head and "<body" not in head:
+            return html_content
+
+    digest = hashlib.blake2b(
+        html_content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    key = (digest, max_length)
+
+    cached = _clean_cache.get(key)
+    if cached is not None:
+        _clean_cache.move_to_end(key)
+        return cached
+
+    cleaned = await clean_html_async(html_content, max_length)
+    _clean_cache[key] = cleaned
+    if len(_clean_cache) > _CLEAN_CACHE_SIZE:
+        _clean_cache.popitem(last=False)
+    return cleaned
+
+
 EXTRACTION_PROMPT = """You are a job posting data extractor. Analyze the following content from a job posting page.
 
 Extract the job information and call the extract_job_data function with the extracted data.
@@ -137,9 +240,23 @@ class GeminiExtractor:
         if not settings.gemini_api_key:
             raise ValueError("GEMINI_API_KEY not configured")
 
-        self._client = genai.Client(api_key=settings.gemini_api_key)
+        self._client = genai.Client(api_key=settings.gemini_api_key, http_options=_HTTP_OPTIONS)
         return self._client
 
+    async def warm_up(self) -> None:
+        """Create the client and open a pooled connection to the Gemini API.
+
+        Best effort: failures are logged and the first extraction simply pays
+        the setup cost instead.
+        """
+        if not settings.gemini_api_key:
+            return
+        try:
+            client = self._ensure_client()
+            await client.aio.models.get(model=GEMINI_MODELS[0])
+        except Exception as e:
+            logger.warning(f"Gemini warm-up failed: {e}")
+
     async def extract(self, html_content: str, url: str) -> AIExtractedJob:
         """
         Extract job data from HTML content using Gemini.
@@ -157,91 +274,131 @@ class GeminiExtractor:
         client = self._ensure_client()
 
         # Clean and optimize the content for LLM extraction
-        cleaned_content = clean_html_for_extraction(html_content, max_length=25000)
+        cleaned_content = await _clean_cached(html_content, max_length=25000)
         logger.debug(f"Cleaned content: {len(html_content)} -> {len(cleaned_content)} chars")
 
         prompt = f"{EXTRACTION_PROMPT}\n\nURL: {url}\n\n{cleaned_content}"
 
-        last_error = None
-
-        for model_name in GEMINI_MODELS:
-            try:
-                logger.info(f"Trying Gemini model: {model_name}")
+        last_error: Exception | None = None
 
-                # Try function calling first (guaranteed structured output)
-                result = await self._try_function_calling(client, model_name, prompt)
+        # Hedge the top models: run them concurrently and take the first
+        # successful result, so a slow or failing primary doesn't add its
+        # full latency before the fallback is tried.
+        tasks = [
+            asyncio.create_task(self._try_model(client, model_name, prompt))
+            for model_name in GEMINI_MODELS[:HEDGED_MODEL_COUNT]
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    last_error = e
+                    continue
                 if result:
-                    result.model_used = model_name
-                    logger.info(f"Successfully extracted with {model_name} (function calling)")
                     return result
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                # Fallback to text-based extraction
-                result = await self._try_text_extraction(client, model_name, prompt)
+        # Degraded path: try the remaining models one at a time
+        for model_name in GEMINI_MODELS[HEDGED_MODEL_COUNT:]:
+            try:
+                result = await self._try_model(client, model_name, prompt)
                 if result:
-                    result.model_used = model_name
-                    logger.info(f"Successfully extracted with {model_name} (text)")
                     return result
-
             except Exception as e:
-                logger.warning(f"Model {model_name} failed: {e}")
                 last_error = e
                 continue
 
         raise ValueError(f"All Gemini models failed. Last error: {last_error}")
 
-    async def _try_function_calling(
+    async def _try_model(
         self, client: genai.Client, model_name: str, prompt: str
     ) -> AIExtractedJob | None:
-        """Try extraction using function calling for structured output."""
+        """Extract with a single model: function calling first, then text."""
         try:
-            response = await client.aio.models.generate_content(
-                model=model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1,
-                    max_output_tokens=4096,
-                    tools=[types.Tool(function_declarations=[EXTRACT_JOB_FUNCTION])],
-                    tool_config=types.ToolConfig(
-                        function_calling_config=types.FunctionCallingConfig(
-                            mode="ANY",
-                        )
-                    ),
+            logger.info(f"Trying Gemini model: {model_name}")
+
+            # Try function calling first (guaranteed structured output)
+            result, raw_text = await self._try_function_calling(client, model_name, prompt)
+            if result:
+                result.model_used = model_name
+                logger.info(f"Successfully extracted with {model_name} (function calling)")
+                return result
+
+            # Fallback to text-based extraction, reusing any text the model
+            # already answered with before paying for a second request
+            result = await self._try_text_extraction(client, model_name, prompt, raw_text)
+            if result:
+                result.model_used = model_name
+                logger.info(f"Successfully extracted with {model_name} (text)")
+                return result
+
+            return None
+
+        except Exception as e:
+            logger.warning(f"Model {model_name} failed: {e}")
+            raise
+
+    async def _try_function_calling(
+        self, client: genai.Client, model_name: str, prompt: str
+    ) -> tuple[AIExtractedJob | None, str]:
+        """Try extraction using function calling for structured output.
+
+        Returns the extracted job (or None) and any plain text the model
+        produced instead of a function call.
+        """
+        text_parts: list[str] = []
+        try:
+            # Declared as an AsyncIterator, but the SDK returns an async
+            # generator, which is what aclosing() needs
+            stream = cast(
+                AsyncGenerator[types.GenerateContentResponse, None],
+                await client.aio.models.generate_content_stream(
+                    model=model_name,
+                    contents=prompt,
+                    config=_FUNCCALL_CONFIG,
                 ),
             )
 
-            # Extract function call result
-            if response.candidates and response.candidates[0].content.parts:
-                for part in response.candidates[0].content.parts:
-                    if part.function_call:
-                        args = dict(part.function_call.args)
-
-                        if not args.get("title"):
-                            logger.warning("No title in function call response")
-                            return None
-
-                        return AIExtractedJob(
-                            title=args.get("title"),
-                            company=args.get("company"),
-                            location=args.get("location"),
-                            description=args.get("description"),
-                            salary_range=args.get("salary_range"),
-                            job_type=args.get("job_type"),
-                            requirements=args.get("requirements"),
-                            remote_type=args.get("remote_type"),
-                            easy_apply=args.get("easy_apply"),
-                            employment_type=args.get("employment_type"),
-                        )
+            # Stop at the first function call; closing the stream abandons
+            # any trailing output the model is still decoding.
+            async with aclosing(stream) as chunks:
+                async for chunk in chunks:
+                    if not (chunk.candidates and chunk.candidates[0].content):
+                        continue
+                    for part in chunk.candidates[0].content.parts or []:
+                        if part.function_call:
+                            args = part.function_call.args or {}
 
-            return None
+                            if not args.get("title"):
+                                logger.warning("No title in function call response")
+                                return None, ""
+
+                            return _job_from_mapping(args), ""
+                        if part.text:
+                            text_parts.append(part.text)
+
+            return None, "".join(text_parts)
 
         except Exception as e:
             logger.debug(f"Function calling failed for {model_name}: {e}")
-            return None
+            return None, ""
 
     async def _try_text_extraction(
-        self, client: genai.Client, model_name: str, prompt: str
+        self, client: genai.Client, model_name: str, prompt: str, raw_text: str = ""
     ) -> AIExtractedJob | None:
-        """Fallback to text-based JSON extraction."""
+        """Fallback to text-based JSON extraction.
+
+        If ``raw_text`` (the function-calling response's text) already holds
+        the JSON, it is parsed directly and no second request is made.
+        """
+        if raw_text:
+            result = self._parse_json_job(raw_text, model_name)
+            if result:
+                return result
+
         # Use a simpler prompt for text extraction
         text_prompt = prompt.replace(
             "call the extract_job_data function with the extracted data",
@@ -251,50 +408,32 @@ class GeminiExtractor:
         response = await client.aio.models.generate_content(
             model=model_name,
             contents=text_prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.1,
-                max_output_tokens=4096,
-            ),
+            config=_TEXT_CONFIG,
         )
 
         if not response.text:
             return None
 
-        # Parse JSON response
-        json_text = response.text.strip()
+        return self._parse_json_job(response.text, model_name)
 
+    def _parse_json_job(self, text: str, model_name: str) -> AIExtractedJob | None:
+        """Parse a JSON job object out of a model's text response."""
         # Remove markdown code blocks if present
-        if json_text.startswith("```json"):
-            json_text = json_text[7:]
-        if json_text.startswith("```"):
-            json_text = json_text[3:]
-        if json_text.endswith("```"):
-            json_text = json_text[:-3]
-        json_text = json_text.strip()
+        match = _MD_CODE_RE.match(text)
+        json_text = match.group(1) if match else text.strip()
 
         try:
-            data = json.loads(json_text)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(json_text)
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON from {model_name}: {e}")
-            logger.debug(f"Raw response: {response.text}")
+            logger.debug(f"Raw response: {text}")
             return None
 
-        if not data.get("title"):
+        if not isinstance(data, dict) or not data.get("title"):
             logger.warning(f"No title extracted from {model_name}")
             return None
 
-        return AIExtractedJob(
-            title=data.get("title"),
-            company=data.get("company"),
-            location=data.get("location"),
-            description=data.get("description"),
-            salary_range=data.get("salary_range"),
-            job_type=data.get("job_type"),
-            requirements=data.get("requirements"),
-            remote_type=data.get("remote_type"),
-            easy_apply=data.get("easy_apply"),
-            employment_type=data.get("employment_type"),
-        )
+        return _job_from_mapping(data)
 
 
 # Singleton instance
@@ -8,11 +8,141 @@ Cleans HTML content to improve LLM extraction quality by:
 - Converting to clean markdown/text
 """
 
+import asyncio
 import json
 import re
+from concurrent.futures import Executor
 
-import html2text
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, NavigableString, PageElement, Tag
+from bs4.element import PreformattedString
+
+from src.config import settings
+
+# Noise blocks dropped from the raw markup before parsing, so the parser never
+# builds trees for inline JS bundles, CSS and icon sprites. JSON-LD scripts are
+# kept for _extract_structured_data. Whatever this misses is still removed by
+# _remove_noise_elements after parsing.
+_NOISE_BLOCK_RE = re.compile(
+    r"<(script|style|noscript|svg)\b(?![^>]*application/ld\+json)[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Tags removed completely, and nav-like tags removed unless they mention the job
+_NOISE_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "iframe",
+        "svg",
+        "canvas",
+        "video",
+        "audio",
+        "picture",
+        "source",
+        "template",
+        "slot",
+    }
+)
+_NAV_TAGS = frozenset({"nav", "footer"})
+_JOB_KEYWORDS = (
+    "apply",
+    "requirements",
+    "responsibilities",
+    "salary",
+    "location",
+    "job type",
+)
+
+# Content containers in priority order, as soup.find() arguments rather than
+# CSS selectors (a compiled regex on an attribute matches like [attr*="..."])
+_CONTENT_CONTAINERS: tuple[tuple[str, dict], ...] = (
+    # Job-specific containers
+    ("div", {"class": re.compile("job-description")}),
+    ("div", {"class": re.compile("job-content")}),
+    ("div", {"class": re.compile("job-details")}),
+    ("div", {"class": re.compile("posting-description")}),
+    ("div", {"id": re.compile("job-description")}),
+    ("div", {"id": re.compile("job-content")}),
+    # Generic content containers
+    ("main", {}),
+    ("article", {}),
+    ("div", {"role": "main"}),
+    ("div", {"class": re.compile("content")}),
+    ("div", {"class": re.compile("main")}),
+)
+
+# Markdown emission (_html_to_text)
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+_EMPHASIS_MARKS = {"strong": "**", "b": "**", "em": "_", "i": "_", "code": "`"}
+_SKIP_TAGS = frozenset({"img", "head", "title", "meta", "link", "button", "select", "input"})
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "header",
+        "aside",
+        "ul",
+        "ol",
+        "dl",
+        "dt",
+        "dd",
+        "table",
+        "form",
+        "fieldset",
+        "figure",
+        "hr",
+    }
+)
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_LINE_EDGES = re.compile(r"[ \t]*\n[ \t]*")
+
+# Lines made only of these (e.g. "---", "***", "|") are dropped by _postprocess_text
+_SYMBOL_CHARS = "*-_=#|"
+
+
+# Upper bound on the markup handed to the parser. Applied after noise
+# stripping, so it only bites on pages with a genuinely huge DOM, where the
+# tail (footers, related jobs) is the part least worth parsing.
+HARD_HTML_CAP = 512_000
+_CAP_BOUNDARY_WINDOW = 8192
+
+# Executor for CPU-bound HTML cleaning. The API lifespan installs a process
+# pool (BeautifulSoup tree building is Python code that holds the GIL, so
+# threads would not run it in parallel); elsewhere (CLI, scripts) it stays None
+# and the loop's default thread pool is used, which still keeps the event loop
+# responsive.
+_cpu_pool: Executor | None = None
+
+
+def set_cpu_pool(pool: Executor | None) -> None:
+    """Set the executor used by clean_html_async."""
+    global _cpu_pool
+    _cpu_pool = pool
+
+
+async def clean_html_async(html_content: str, max_length: int = 30000) -> str:
+    """Run clean_html_for_extraction off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _cpu_pool, clean_html_for_extraction, html_content, max_length
+    )
+
+
+def _cap_html(html_content: str) -> str:
+    """Truncate markup to HARD_HTML_CAP, preferring to cut before a closing tag."""
+    if len(html_content) <= HARD_HTML_CAP:
+        return html_content
+    cut = html_content.rfind("</", HARD_HTML_CAP - _CAP_BOUNDARY_WINDOW, HARD_HTML_CAP)
+    return html_content[: cut if cut != -1 else HARD_HTML_CAP]
+
+
+def strip_noise_markup(html_content: str) -> str:
+    """Remove script/style/noscript/svg blocks (except JSON-LD) from raw HTML."""
+    return _NOISE_BLOCK_RE.sub("", html_content)
 
 
 def clean_html_for_extraction(html_content: str, max_length: int = 30000) -> str:
@@ -26,7 +156,8 @@ def clean_html_for_extraction(html_content: str, max_length: int = 30000) -> str
     Returns:
         Cleaned text content optimized for LLM extraction
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    markup = _cap_html(strip_noise_markup(html_content))
+    soup = BeautifulSoup(markup, settings.html_parser)
 
     # 1. Extract structured data BEFORE removing scripts
     structured_data = _extract_structured_data(soup)
@@ -41,7 +172,7 @@ def clean_html_for_extraction(html_content: str, max_length: int = 30000) -> str
     main_content = _extract_main_content(soup)
 
     # 5. Convert to clean text/markdown
-    cleaned_text = _html_to_text(str(main_content))
+    cleaned_text = _html_to_text(main_content)
 
     # 6. Post-process text
     cleaned_text = _postprocess_text(cleaned_text)
@@ -64,47 +195,78 @@ def clean_html_for_extraction(html_content: str, max_length: int = 30000) -> str
     return cleaned_text
 
 
-def _extract_structured_data(soup: BeautifulSoup) -> str | None:
-    """Extract JSON-LD structured data from script tags."""
-    json_ld_scripts = soup.find_all("script", {"type": "application/ld+json"})
+def parse_jobposting_ld(data: object) -> dict[str, str] | None:
+    """Pull the job fields out of a parsed JSON-LD object.
 
-    structured_parts = []
-    for script in json_ld_scripts:
+    Returns None unless data is a JobPosting. Only the fields present are
+    included: title, company, location, employment_type, description.
+    """
+    if not isinstance(data, dict) or data.get("@type") != "JobPosting":
+        return None
+
+    fields: dict[str, str] = {}
+    if data.get("title"):
+        fields["title"] = data["title"]
+    organization = data.get("hiringOrganization")
+    if isinstance(organization, dict) and organization.get("name"):
+        fields["company"] = organization["name"]
+    loc = data.get("jobLocation")
+    if isinstance(loc, list) and loc:
+        loc = loc[0]
+    if isinstance(loc, dict):
+        addr = loc.get("address", {})
+        if isinstance(addr, dict):
+            location_parts = [
+                addr.get("addressLocality"),
+                addr.get("addressRegion"),
+                addr.get("addressCountry"),
+            ]
+            location = ", ".join(p for p in location_parts if isinstance(p, str) and p)
+            if location:
+                fields["location"] = location
+    if data.get("employmentType"):
+        fields["employment_type"] = data["employmentType"]
+    if data.get("description"):
+        fields["description"] = data["description"]
+    return fields
+
+
+def extract_jobpostings_ld(soup: BeautifulSoup) -> list[dict[str, str]]:
+    """Parse every JobPosting JSON-LD script in the page."""
+    postings = []
+    for script in soup.find_all("script", {"type": "application/ld+json"}):
+        content = script.string
+        if not content:
+            continue
         try:
-            content = script.string
-            if content:
-                # Parse and re-format for cleaner output
-                data = json.loads(content)
-                # Check if it's job-related
-                if isinstance(data, dict) and data.get("@type") == "JobPosting":
-                    # Format key job fields
-                    job_info = []
-                    if data.get("title"):
-                        job_info.append(f"Job Title: {data['title']}")
-                    if data.get("hiringOrganization", {}).get("name"):
-                        job_info.append(f"Company: {data['hiringOrganization']['name']}")
-                    if data.get("jobLocation"):
-                        loc = data["jobLocation"]
-                        if isinstance(loc, dict):
-                            addr = loc.get("address", {})
-                            location_parts = [
-                                addr.get("addressLocality"),
-                                addr.get("addressRegion"),
-                                addr.get("addressCountry"),
-                            ]
-                            location = ", ".join(p for p in location_parts if p)
-                            if location:
-                                job_info.append(f"Location: {location}")
-                    if data.get("employmentType"):
-                        job_info.append(f"Employment Type: {data['employmentType']}")
-                    if data.get("description"):
-                        # Truncate long descriptions
-                        desc = data["description"][:2000]
-                        job_info.append(f"Description: {desc}")
-                    if job_info:
-                        structured_parts.append("\n".join(job_info))
+            fields = parse_jobposting_ld(json.loads(content))
         except (json.JSONDecodeError, TypeError):
             continue
+        if fields:
+            postings.append(fields)
+    return postings
+
+
+def _extract_structured_data(soup: BeautifulSoup) -> str | None:
+    """Extract JSON-LD structured data from script tags."""
+    structured_parts = []
+    for fields in extract_jobpostings_ld(soup):
+        # Format key job fields
+        job_info = []
+        if "title" in fields:
+            job_info.append(f"Job Title: {fields['title']}")
+        if "company" in fields:
+            job_info.append(f"Company: {fields['company']}")
+        if "location" in fields:
+            job_info.append(f"Location: {fields['location']}")
+        if "employment_type" in fields:
+            job_info.append(f"Employment Type: {fields['employment_type']}")
+        if "description" in fields:
+            # Truncate long descriptions
+            desc = fields["description"][:2000]
+            job_info.append(f"Description: {desc}")
+        if job_info:
+            structured_parts.append("\n".join(job_info))
 
     return "\n\n".join(structured_parts) if structured_parts else None
 
@@ -140,78 +302,42 @@ def _extract_meta_tags(soup: BeautifulSoup) -> str | None:
 
 
 def _remove_noise_elements(soup: BeautifulSoup) -> None:
-    """Remove script, style, and other noise elements in place."""
-    # Tags to remove completely
-    noise_tags = [
-        "script",
-        "style",
-        "noscript",
-        "iframe",
-        "svg",
-        "canvas",
-        "video",
-        "audio",
-        "picture",
-        "source",
-        "template",
-        "slot",
-    ]
-
-    for tag in noise_tags:
-        for element in soup.find_all(tag):
-            element.decompose()
-
-    # Remove HTML comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
+    """Remove script, style, and other noise elements in place.
 
-    # Remove elements with hidden attributes
-    for element in soup.find_all(attrs={"hidden": True}):
-        element.decompose()
-
-    for element in soup.find_all(attrs={"aria-hidden": "true"}):
-        element.decompose()
-
-    # Remove common navigation/footer elements (but keep if they contain job info)
-    for selector in ["nav", "footer"]:
-        for element in soup.find_all(selector):
-            # Only remove if it doesn't contain job-related keywords
+    Collects everything in a single walk over the tree, then removes it.
+    """
+    to_remove = []
+    for element in soup.descendants:
+        if isinstance(element, Comment) or (
+            isinstance(element, Tag)
+            and (
+                element.name in _NOISE_TAGS
+                or element.has_attr("hidden")
+                or element.get("aria-hidden") == "true"
+                or element.name in _NAV_TAGS
+            )
+        ):
+            to_remove.append(element)
+
+    for element in to_remove:
+        # Skip anything already removed along with a removed ancestor
+        if element.decomposed:
+            continue
+        if isinstance(element, Comment):
+            element.extract()
+            continue
+        # Keep navigation/footer elements that contain job info
+        if element.name in _NAV_TAGS:
             text = element.get_text(strip=True).lower()
-            if not any(
-                kw in text
-                for kw in [
-                    "apply",
-                    "requirements",
-                    "responsibilities",
-                    "salary",
-                    "location",
-                    "job type",
-                ]
-            ):
-                element.decompose()
+            if any(kw in text for kw in _JOB_KEYWORDS):
+                continue
+        element.decompose()
 
 
 def _extract_main_content(soup: BeautifulSoup) -> BeautifulSoup:
     """Extract the main content area from the page."""
-    # Priority order for content containers
-    content_selectors = [
-        # Job-specific containers
-        'div[class*="job-description"]',
-        'div[class*="job-content"]',
-        'div[class*="job-details"]',
-        'div[class*="posting-description"]',
-        'div[id*="job-description"]',
-        'div[id*="job-content"]',
-        # Generic content containers
-        "main",
-        "article",
-        'div[role="main"]',
-        'div[class*="content"]',
-        'div[class*="main"]',
-    ]
-
-    for selector in content_selectors:
-        content = soup.select_one(selector)
+    for name, attrs in _CONTENT_CONTAINERS:
+        content = soup.find(name, attrs=attrs)
         if content:
             # Check if it has substantial text
             text = content.get_text(strip=True)
@@ -223,38 +349,90 @@ def _extract_main_content(soup: BeautifulSoup) -> BeautifulSoup:
     return body if body else soup
 
 
-def _html_to_text(html: str) -> str:
-    """Convert HTML to clean markdown-like text."""
-    h = html2text.HTML2Text()
-    h.ignore_links = False  # Keep links for context
-    h.ignore_images = True
-    h.ignore_emphasis = False
-    h.body_width = 0  # No line wrapping
-    h.unicode_snob = True
-    h.skip_internal_links = True
-    h.inline_links = False  # Put links at end
-    h.protect_links = True
+class _Emit(str):
+    """Literal output queued on the _html_to_text stack (vs. a document node)."""
 
-    return h.handle(html)
 
+def _html_to_text(root: Tag) -> str:
+    """Convert an already-parsed subtree to clean markdown-like text.
 
-def _postprocess_text(text: str) -> str:
-    """Post-process the extracted text."""
-    # Remove excessive blank lines (more than 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-
-    # Remove lines that are just symbols/punctuation
-    lines = text.split("\n")
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.strip()
-        # Skip lines that are just symbols
-        if stripped and not re.match(r"^[\*\-_=#\|]+$", stripped):
-            cleaned_lines.append(line)
+    Walks the tree once with an explicit stack (no serialize/re-parse round
+    trip, no recursion limit on deeply nested pages). Images are dropped,
+    links are kept inline and internal (#anchor) links are reduced to text.
+    """
+    out: list[str] = []
+    stack: list[PageElement] = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _Emit):
+            out.append(node)
+            continue
+        if isinstance(node, NavigableString):
+            # Comments, doctypes, CDATA etc. are PreformattedStrings
+            if not isinstance(node, PreformattedString):
+                out.append(_RE_WHITESPACE.sub(" ", node))
+            continue
+        if not isinstance(node, Tag):
+            continue
+
+        name = node.name
+        if name in _SKIP_TAGS:
+            continue
+        if name == "br":
+            out.append("\n")
+            continue
+        if name == "pre":
+            out.append(f"\n\n```\n{node.get_text().strip(chr(10))}\n```\n\n")
+            continue
+
+        prefix = suffix = ""
+        if name in _HEADING_LEVELS:
+            prefix = "\n\n" + "#" * _HEADING_LEVELS[name] + " "
+            suffix = "\n\n"
+        elif name == "li":
+            if node.parent is not None and node.parent.name == "ol":
+                number = 1 + sum(1 for _ in node.find_previous_siblings("li"))
+                prefix = f"\n{number}. "
+            else:
+                prefix = "\n- "
+            suffix = "\n"
+        elif name == "a":
+            href = node.get("href", "")
+            if href and not href.startswith(("#", "javascript:")):
+                prefix, suffix = "[", f"]({href})"
+        elif name in _EMPHASIS_MARKS:
+            prefix = suffix = _EMPHASIS_MARKS[name]
+        elif name == "blockquote":
+            prefix, suffix = "\n\n> ", "\n\n"
+        elif name in ("td", "th"):
+            suffix = " | "
+        elif name == "tr":
+            prefix, suffix = "\n", "\n"
+        elif name in _BLOCK_TAGS:
+            prefix = suffix = "\n\n"
+
+        out.append(prefix)
+        stack.append(_Emit(suffix))
+        stack.extend(reversed(node.contents))
+
+    return _RE_LINE_EDGES.sub("\n", "".join(out))
 
-    text = "\n".join(cleaned_lines)
 
-    # Collapse multiple spaces
-    text = re.sub(r" {2,}", " ", text)
+def _postprocess_text(text: str) -> str:
+    """Post-process the extracted text.
 
+    Drops blank and symbol-only lines and collapses runs of spaces, using
+    str methods (C-level scans) rather than a regex per line.
+    """
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        # Stripping the symbols leaves nothing on a symbol-only line
+        if stripped and stripped.strip(_SYMBOL_CHARS):
+            lines.append(line)
+    text = "\n".join(lines)
+
+    # Each pass halves every run of spaces
+    while "  " in text:
+        text = text.replace("  ", " ")
     return text.strip()
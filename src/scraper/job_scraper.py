@@ -5,13 +5,25 @@ Hybrid approach:
 2. Slow path: Playwright rendering + AI extraction (for JS-heavy sites)
 """
 
+import asyncio
+import html as html_lib
 import logging
 import re
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from cachetools import TTLCache
+
+from src.config import settings
+from src.scraper.content_cleaner import extract_jobpostings_ld, strip_noise_markup
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, Route
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +40,127 @@ class ScrapedJob:
     job_type: str | None = None
     source_platform: str | None = None
     requirements: list[str] | None = None
-    extraction_method: str = "traditional"  # "traditional", "playwright", "ai"
+    extraction_method: str = "traditional"  # "traditional", "jsonld", "playwright", "ai"
+
+
+# Class-attribute patterns used by the generic (platform-agnostic) extractors
+_RE_COMPANY_CLASSES = (
+    re.compile(r"company", re.I),
+    re.compile(r"employer", re.I),
+    re.compile(r"organization", re.I),
+)
+_RE_LOCATION_CLASSES = (
+    re.compile(r"location", re.I),
+    re.compile(r"address", re.I),
+)
+_RE_DESCRIPTION_CLASS = re.compile(r"description", re.I)
+_RE_JOB_CONTENT_CLASS = re.compile(r"job.?content", re.I)
+_RE_SALARY_CLASS = re.compile(r"salary|compensation|pay", re.I)
+_RE_JOB_TYPE_CLASS = re.compile(r"type|employment|work.?arrangement", re.I)
+
+# (field, tag names, attribute, pattern) in per-field priority order. All rules
+# are matched in a single walk over the tree by _scan_generic_candidates.
+_GENERIC_SCAN_RULES: tuple[tuple[str, frozenset[str], str, re.Pattern[str]], ...] = (
+    *(("company", frozenset({"a", "span", "div"}), "class", p) for p in _RE_COMPANY_CLASSES),
+    *(("location", frozenset({"span", "div", "p"}), "class", p) for p in _RE_LOCATION_CLASSES),
+    ("description", frozenset({"div", "section", "article"}), "class", _RE_DESCRIPTION_CLASS),
+    ("description", frozenset({"div", "section", "article"}), "class", _RE_JOB_CONTENT_CLASS),
+    ("description", frozenset({"div", "section", "article"}), "id", _RE_DESCRIPTION_CLASS),
+    ("salary", frozenset({"span", "div", "p"}), "class", _RE_SALARY_CLASS),
+    ("job_type", frozenset({"span", "div", "li"}), "class", _RE_JOB_TYPE_CLASS),
+)
+
+# Generic candidates per field: one list of matching elements (document order)
+# per rule, in the rule's priority order
+GenericCandidates = dict[str, list[list[Tag]]]
+
+# Selectors simple enough to run as soup.find(): "tag", "tag.class", "tag#id",
+# "tag[attr='value']" (tag optional). Anything else goes through select_one.
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"""([a-zA-Z][\w-]*)?(?:\.([\w-]+)|#([\w-]+)|\[([\w:-]+)=['"]([^'"]+)['"]\])?"""
+)
+
+# A compiled selector: ("meta", None, attrs) reads the content attribute,
+# ("find", name, attrs) and ("css", selector, None) read element text.
+CompiledSelector = tuple[str, str | None, dict[str, str] | None]
+
+
+def _attr_matches(pattern: re.Pattern[str], value: str | list[str]) -> bool:
+    """Match an attribute the way soup.find(attr=pattern) does."""
+    if isinstance(value, str):
+        return pattern.search(value) is not None
+    # Multi-valued (class): any single value, or the whole space-joined string
+    return any(pattern.search(v) for v in value) or (
+        len(value) > 1 and pattern.search(" ".join(value)) is not None
+    )
 
 
+def _scan_generic_candidates(soup: BeautifulSoup) -> GenericCandidates:
+    """Collect generic extractor candidates in one pass over the tree.
+
+    Replaces a separate soup.find/find_all traversal per pattern.
+    """
+    hits: list[list[Tag]] = [[] for _ in _GENERIC_SCAN_RULES]
+    for tag in soup.find_all(True):
+        attrs = tag.attrs
+        if "class" not in attrs and "id" not in attrs:
+            continue
+        name = tag.name
+        for i, (_, names, attr, pattern) in enumerate(_GENERIC_SCAN_RULES):
+            if name in names and attr in attrs and _attr_matches(pattern, attrs[attr]):
+                hits[i].append(tag)
+
+    candidates: GenericCandidates = {}
+    for (field, *_), elements in zip(_GENERIC_SCAN_RULES, hits, strict=True):
+        candidates.setdefault(field, []).append(elements)
+    return candidates
+
+
+def _compile_selector(selector: str) -> CompiledSelector:
+    """Pre-parse a CSS selector into a cheap lookup for _extract_text."""
+    match = _SIMPLE_SELECTOR_RE.fullmatch(selector)
+    if not match or not any(match.groups()):
+        return ("css", selector, None)
+
+    name, class_name, element_id, attr, value = match.groups()
+    if class_name:
+        attrs = {"class": class_name}
+    elif element_id:
+        attrs = {"id": element_id}
+    elif attr:
+        attrs = {attr: value}
+    else:
+        attrs = {}
+    return ("meta" if name == "meta" else "find", name, attrs)
+
+
+# Salary ranges, as one alternation so each text is scanned once
+_SALARY_RE = re.compile(
+    "|".join(
+        (
+            r"\$[\d,]+\s*[-–]\s*\$[\d,]+",  # $100,000 - $150,000
+            r"£[\d,]+\s*[-–]\s*£[\d,]+",  # £50,000 - £70,000
+            r"€[\d,]+\s*[-–]\s*€[\d,]+",  # €50,000 - €70,000
+            r"\$[\d,]+\s*(?:k|K)\s*[-–]\s*\$?[\d,]+\s*(?:k|K)?",  # $100k - $150k
+        )
+    )
+)
+
+_JOB_TYPES = (
+    "full-time",
+    "full time",
+    "part-time",
+    "part time",
+    "contract",
+    "temporary",
+    "internship",
+    "freelance",
+    "remote",
+)
+
+# Upper bound on downloaded HTML; extraction only ever uses the first part of a page
+MAX_HTML_BYTES = 2 * 1024 * 1024
+
 # Sites known to require JavaScript rendering
 JS_HEAVY_SITES = [
     "bamboohr.com",
@@ -42,6 +172,74 @@ JS_HEAVY_SITES = [
     "smartrecruiters.com",
     "successfactors.com",
 ]
+_JS_HEAVY_SET = frozenset(JS_HEAVY_SITES)
+
+# Scrape results by (normalized URL, use_ai_fallback), shared across scraper
+# instances so webhook retries and duplicate imports skip the fetch and the
+# LLM call. Per-key locks make concurrent duplicates wait for the first one.
+SCRAPE_CACHE_TTL = 3600
+_scrape_cache: TTLCache[tuple[str, bool], ScrapedJob] = TTLCache(
+    maxsize=4096, ttl=SCRAPE_CACHE_TTL
+)
+_scrape_locks: dict[tuple[str, bool], asyncio.Lock] = {}
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for cache keys.
+
+    Scheme and host are case-insensitive and fragments never reach the
+    server; the query is kept because boards identify jobs there
+    (e.g. indeed.com/viewjob?jk=...).
+    """
+    parsed = urlparse(url.strip())
+    return parsed._replace(
+        scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment=""
+    ).geturl()
+
+
+# Playwright rendering pool. Sync Playwright objects are bound to the thread
+# that created them, so each worker thread owns its browser; browsers are
+# launched on first use and live for the rest of the process.
+RENDER_WORKERS = 2
+_render_pool: ThreadPoolExecutor | None = None
+_render_local = threading.local()
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for Playwright renders."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ThreadPoolExecutor(
+            max_workers=RENDER_WORKERS, thread_name_prefix="playwright-render"
+        )
+    return _render_pool
+
+
+def _get_thread_browser() -> "Browser":
+    """Get the calling worker thread's browser, launching it if needed."""
+    browser = getattr(_render_local, "browser", None)
+    if browser is None or not browser.is_connected():
+        if getattr(_render_local, "playwright", None) is None:
+            from playwright.sync_api import sync_playwright
+
+            _render_local.playwright = sync_playwright().start()
+        browser = _render_local.playwright.chromium.launch(headless=True)
+        _render_local.browser = browser
+    return browser
+
+
+# Any of these means the job content has rendered
+RENDER_READY_SELECTOR = "h1, [data-automation-id='jobPostingHeader'], .job-description, main"
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+def _block_heavy_resources(route: "Route") -> None:
+    """Abort requests for assets the scraper never reads."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
 
 
 class JobScraper:
@@ -120,10 +318,36 @@ class JobScraper:
         },
     }
 
+    # PLATFORM_SELECTORS parsed once at class definition for the hot path
+    _COMPILED_SELECTORS: dict[str, dict[str, tuple[CompiledSelector, ...]]] = {
+        platform: {field: tuple(map(_compile_selector, sels)) for field, sels in fields.items()}
+        for platform, fields in PLATFORM_SELECTORS.items()
+    }
+    # One scan over the domain instead of a substring check per platform; the
+    # alternatives are the literal keys, so the match is the platform key itself
+    _PLATFORM_RE = re.compile("|".join(map(re.escape, PLATFORM_SELECTORS)))
+
     def __init__(self, timeout: float = 30.0, use_ai_fallback: bool = True):
         """Initialize the scraper."""
         self.timeout = timeout
         self.use_ai_fallback = use_ai_fallback
+        # Shared across fetches so connections (and TLS sessions) are reused
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.USER_AGENT},
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "JobScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def scrape(self, url: str) -> ScrapedJob:
         """
@@ -143,6 +367,26 @@ class JobScraper:
             httpx.HTTPError: If the request fails
             ValueError: If unable to extract required data
         """
+        key = (_normalize_url(url), self.use_ai_fallback)
+        cached = _scrape_cache.get(key)
+        if cached is not None:
+            return replace(cached)
+
+        lock = _scrape_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = _scrape_cache.get(key)
+                if cached is None:
+                    cached = _scrape_cache[key] = await self._scrape_uncached(url)
+                else:
+                    logger.info(f"Using cached scrape result for {url}")
+        finally:
+            if not lock.locked() and _scrape_locks.get(key) is lock:
+                del _scrape_locks[key]
+        return replace(cached)
+
+    async def _scrape_uncached(self, url: str) -> ScrapedJob:
+        """Run the hybrid scrape pipeline without consulting the cache."""
         # Detect platform
         platform = self._detect_platform(url)
 
@@ -193,48 +437,54 @@ class JobScraper:
 
     def _is_js_heavy_site(self, url: str) -> bool:
         """Check if URL belongs to a known JS-heavy site."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-
-        for js_site in JS_HEAVY_SITES:
-            if js_site in domain:
-                return True
+        domain = (urlparse(url).hostname or "").rstrip(".")
 
-        return False
+        # Hash lookups on each domain suffix ("jobs.acme.icims.com" ->
+        # "acme.icims.com", "icims.com") instead of a substring scan per site
+        parts = domain.split(".")
+        return any(".".join(parts[i:]) in _JS_HEAVY_SET for i in range(len(parts) - 1))
 
     async def _scrape_traditional(self, url: str, platform: str | None) -> ScrapedJob:
         """Traditional HTTP + BeautifulSoup scraping."""
         # Fetch page content
         html = await self._fetch_page(url)
 
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
+        # Parse HTML (without script/style noise, which would also leak into get_text())
+        soup = BeautifulSoup(strip_noise_markup(html), settings.html_parser)
+
+        # A complete JSON-LD JobPosting makes selectors (and any AI fallback) unnecessary
+        structured = self._scrape_json_ld(soup, platform)
+        if structured:
+            return structured
 
         # Get platform-specific selectors or use generic ones
-        selectors = self.PLATFORM_SELECTORS.get(platform, {})
+        selectors = self._COMPILED_SELECTORS.get(platform, {})
+        candidates = _scan_generic_candidates(soup)
 
         # Extract job details
-        title = self._extract_text(soup, selectors.get("title", []))
+        title = self._extract_text(soup, selectors.get("title", ()))
         if not title:
             title = self._extract_generic_title(soup)
 
         if not title:
             raise ValueError(f"Could not extract job title from {url}")
 
-        company = self._extract_text(soup, selectors.get("company", []))
+        company = self._extract_text(soup, selectors.get("company", ()))
         if not company:
-            company = self._extract_generic_company(soup)
+            company = self._extract_generic_company(candidates)
 
-        location = self._extract_text(soup, selectors.get("location", []))
+        location = self._extract_text(soup, selectors.get("location", ()))
         if not location:
-            location = self._extract_generic_location(soup)
+            location = self._extract_generic_location(candidates)
 
-        description = self._extract_text(soup, selectors.get("description", []))
+        description, description_element = self._extract_text_and_element(
+            soup, selectors.get("description", ())
+        )
         if not description:
-            description = self._extract_generic_description(soup)
+            description, description_element = self._extract_generic_description(candidates)
 
-        salary_range = self._extract_salary(soup)
-        job_type = self._extract_job_type(soup)
+        salary_range = self._extract_salary(soup, candidates, description_element)
+        job_type = self._extract_job_type(candidates)
 
         return ScrapedJob(
             title=title,
@@ -300,76 +550,132 @@ class JobScraper:
     async def _render_with_playwright(self, url: str) -> str:
         """Render page with Playwright to get JS-rendered content.
 
-        Uses sync Playwright in a thread to work around Windows asyncio limitations.
+        Uses sync Playwright in a dedicated thread pool to work around Windows
+        asyncio limitations. Each worker thread keeps one warm browser, so a
+        render only pays for a new context, not a Chromium launch.
         """
         import asyncio
 
-        # Use sync playwright in a thread to avoid Windows asyncio subprocess issues
         def _render_sync() -> str:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                try:
-                    context = browser.new_context(
-                        user_agent=self.USER_AGENT,
-                        viewport={"width": 1920, "height": 1080},
-                    )
-                    page = context.new_page()
-
-                    # Navigate and wait for content to load
-                    page.goto(url, wait_until="networkidle", timeout=int(self.timeout * 1000))
+            browser = _get_thread_browser()
+            context = browser.new_context(
+                user_agent=self.USER_AGENT,
+                viewport={"width": 1920, "height": 1080},
+            )
+            try:
+                from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-                    # Wait a bit more for dynamic content
-                    page.wait_for_timeout(2000)
+                # The scraper only reads the DOM, so skip downloading assets
+                context.route("**/*", _block_heavy_resources)
+                page = context.new_page()
 
-                    # Get the rendered HTML
-                    content = page.content()
+                # Navigate, then wait for job content rather than for the network to
+                # go idle (analytics beacons on tracker-heavy sites never settle)
+                page.goto(url, wait_until="domcontentloaded", timeout=int(self.timeout * 1000))
+                try:
+                    page.wait_for_selector(RENDER_READY_SELECTOR, timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.debug(f"No job content selector on {url} after 5s, using DOM as is")
 
-                    return content
-                finally:
-                    browser.close()
+                # Get the rendered HTML
+                return page.content()
+            finally:
+                context.close()
 
-        # Run sync playwright in thread pool
-        return await asyncio.to_thread(_render_sync)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_render_pool(), _render_sync)
 
     def _detect_platform(self, url: str) -> str | None:
         """Detect the job board platform from the URL."""
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
 
-        for platform in self.PLATFORM_SELECTORS:
-            if platform in domain:
-                return platform
-
-        return None
+        match = self._PLATFORM_RE.search(domain)
+        return match.group() if match else None
 
     async def _fetch_page(self, url: str) -> str:
-        """Fetch the page content."""
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=True,
-            headers={"User-Agent": self.USER_AGENT},
-        ) as client:
-            response = await client.get(url)
+        """Fetch the page content.
+
+        Streams the body and stops at MAX_HTML_BYTES or once the closing
+        </body> tag has arrived, whichever comes first.
+        """
+        async with self._client.stream("GET", url) as response:
             response.raise_for_status()
-            return response.text
-
-    def _extract_text(self, soup: BeautifulSoup, selectors: list[str]) -> str | None:
-        """Extract text using a list of selectors, trying each until one succeeds."""
-        for selector in selectors:
-            # Handle meta tags specially
-            if selector.startswith("meta["):
-                element = soup.select_one(selector)
+            buf = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                buf += chunk
+                # Look for </body> in the new chunk (plus a tag's length of overlap)
+                tail = buf[-(len(chunk) + 7) :].lower()
+                if len(buf) >= MAX_HTML_BYTES or b"</body>" in tail:
+                    break
+            return buf[:MAX_HTML_BYTES].decode(response.encoding or "utf-8", errors="replace")
+
+    def _scrape_json_ld(self, soup: BeautifulSoup, platform: str | None) -> ScrapedJob | None:
+        """Build a ScrapedJob from JobPosting JSON-LD if it has every core field."""
+        for fields in extract_jobpostings_ld(soup):
+            title = fields.get("title")
+            company = fields.get("company")
+            description = fields.get("description")
+            if not (
+                isinstance(title, str) and isinstance(company, str) and isinstance(description, str)
+            ) or not (title.strip() and company.strip() and description.strip()):
+                continue
+
+            # JSON-LD descriptions are usually HTML (often entity-escaped)
+            description = html_lib.unescape(description)
+            if "<" in description:
+                description = BeautifulSoup(description, settings.html_parser).get_text(
+                    separator="\n", strip=True
+                )
+            if len(description) <= 100:
+                continue
+
+            # schema.org values ("FULL_TIME") in the same form as _extract_job_type
+            employment_type = fields.get("employment_type")
+            if isinstance(employment_type, list):
+                employment_type = ", ".join(map(str, employment_type))
+            if isinstance(employment_type, str):
+                employment_type = employment_type.replace("_", "-").title()
+            salary = _SALARY_RE.search(description)
+
+            return ScrapedJob(
+                title=title.strip(),
+                company=company.strip(),
+                location=fields.get("location"),
+                description=description[:10000],
+                salary_range=salary.group() if salary else None,
+                job_type=employment_type or None,
+                source_platform=platform,
+                extraction_method="jsonld",
+            )
+        return None
+
+    def _extract_text(
+        self, soup: BeautifulSoup, selectors: tuple[CompiledSelector, ...]
+    ) -> str | None:
+        """Extract text using compiled selectors, trying each until one succeeds."""
+        return self._extract_text_and_element(soup, selectors)[0]
+
+    def _extract_text_and_element(
+        self, soup: BeautifulSoup, selectors: tuple[CompiledSelector, ...]
+    ) -> tuple[str | None, Tag | None]:
+        """Like _extract_text, also returning the matched element (None for meta)."""
+        for kind, target, attrs in selectors:
+            if kind == "meta":
+                element = soup.find("meta", attrs=attrs)
                 if element and element.get("content"):
-                    return element["content"].strip()
+                    return element["content"].strip(), None
+                continue
+
+            if kind == "find":
+                element = soup.find(target, attrs=attrs)
             else:
-                element = soup.select_one(selector)
-                if element:
-                    text = element.get_text(separator=" ", strip=True)
-                    if text:
-                        return text
-        return None
+                element = soup.select_one(target)
+            if element:
+                text = element.get_text(separator=" ", strip=True)
+                if text:
+                    return text, element
+        return None, None
 
     def _extract_generic_title(self, soup: BeautifulSoup) -> str | None:
         """Try to extract job title using generic patterns."""
@@ -396,112 +702,68 @@ class JobScraper:
 
         return None
 
-    def _extract_generic_company(self, soup: BeautifulSoup) -> str | None:
+    def _extract_generic_company(self, candidates: GenericCandidates) -> str | None:
         """Try to extract company name using generic patterns."""
         # Look for common company name patterns
-        patterns = [
-            {"class_": re.compile(r"company", re.I)},
-            {"class_": re.compile(r"employer", re.I)},
-            {"class_": re.compile(r"organization", re.I)},
-        ]
-
-        for pattern in patterns:
-            element = soup.find(["a", "span", "div"], **pattern)
-            if element:
-                text = element.get_text(strip=True)
+        for elements in candidates["company"]:
+            if elements:
+                text = elements[0].get_text(strip=True)
                 if text and len(text) < 100:
                     return text
 
         return None
 
-    def _extract_generic_location(self, soup: BeautifulSoup) -> str | None:
+    def _extract_generic_location(self, candidates: GenericCandidates) -> str | None:
         """Try to extract location using generic patterns."""
-        patterns = [
-            {"class_": re.compile(r"location", re.I)},
-            {"class_": re.compile(r"address", re.I)},
-        ]
-
-        for pattern in patterns:
-            element = soup.find(["span", "div", "p"], **pattern)
-            if element:
-                text = element.get_text(strip=True)
+        for elements in candidates["location"]:
+            if elements:
+                text = elements[0].get_text(strip=True)
                 if text and len(text) < 150:
                     return text
 
         return None
 
-    def _extract_generic_description(self, soup: BeautifulSoup) -> str | None:
-        """Try to extract job description using generic patterns."""
-        patterns = [
-            {"class_": re.compile(r"description", re.I)},
-            {"class_": re.compile(r"job.?content", re.I)},
-            {"id": re.compile(r"description", re.I)},
-        ]
-
-        for pattern in patterns:
-            element = soup.find(["div", "section", "article"], **pattern)
-            if element:
-                text = element.get_text(separator="\n", strip=True)
+    def _extract_generic_description(
+        self, candidates: GenericCandidates
+    ) -> tuple[str | None, Tag | None]:
+        """Try to extract job description (and its element) using generic patterns."""
+        for elements in candidates["description"]:
+            if elements:
+                text = elements[0].get_text(separator="\n", strip=True)
                 if text and len(text) > 100:  # Reasonable description length
-                    return text[:10000]  # Limit length
+                    return text[:10000], elements[0]  # Limit length
 
-        return None
+        return None, None
 
-    def _extract_salary(self, soup: BeautifulSoup) -> str | None:
+    def _extract_salary(
+        self,
+        soup: BeautifulSoup,
+        candidates: GenericCandidates,
+        description_element: Tag | None = None,
+    ) -> str | None:
         """Try to extract salary information."""
-        # Look for salary patterns in text
-        salary_patterns = [
-            r"\$[\d,]+\s*[-–]\s*\$[\d,]+",  # $100,000 - $150,000
-            r"£[\d,]+\s*[-–]\s*£[\d,]+",  # £50,000 - £70,000
-            r"€[\d,]+\s*[-–]\s*€[\d,]+",  # €50,000 - €70,000
-            r"\$[\d,]+\s*(?:k|K)\s*[-–]\s*\$?[\d,]+\s*(?:k|K)?",  # $100k - $150k
-        ]
-
         # Search in elements with salary-related classes
-        salary_elements = soup.find_all(
-            ["span", "div", "p"],
-            class_=re.compile(r"salary|compensation|pay", re.I),
-        )
-
-        for element in salary_elements:
-            text = element.get_text(strip=True)
-            for pattern in salary_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group()
-
-        # Search in full page text as fallback
-        page_text = soup.get_text()
-        for pattern in salary_patterns:
-            match = re.search(pattern, page_text)
+        for element in candidates["salary"][0]:
+            match = _SALARY_RE.search(element.get_text(strip=True))
             if match:
                 return match.group()
 
+        # Fall back to the first text node with a salary range, looking in the
+        # description before scanning every text node on the page
+        scopes = (description_element, soup) if description_element else (soup,)
+        for scope in scopes:
+            node = scope.find(string=_SALARY_RE)
+            if node:
+                return _SALARY_RE.search(node).group()
+
         return None
 
-    def _extract_job_type(self, soup: BeautifulSoup) -> str | None:
+    def _extract_job_type(self, candidates: GenericCandidates) -> str | None:
         """Try to extract job type (full-time, part-time, etc.)."""
-        job_types = [
-            "full-time",
-            "full time",
-            "part-time",
-            "part time",
-            "contract",
-            "temporary",
-            "internship",
-            "freelance",
-            "remote",
-        ]
-
         # Search in elements with job type related classes
-        type_elements = soup.find_all(
-            ["span", "div", "li"],
-            class_=re.compile(r"type|employment|work.?arrangement", re.I),
-        )
-
-        for element in type_elements:
+        for element in candidates["job_type"][0]:
             text = element.get_text(strip=True).lower()
-            for job_type in job_types:
+            for job_type in _JOB_TYPES:
                 if job_type in text:
                     return job_type.title().replace(" ", "-")
 
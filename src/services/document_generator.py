@@ -1,8 +1,10 @@
 """Document generation service for CV and Cover Letter export."""
 
 import io
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
+from functools import cache
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -10,6 +12,104 @@ from docx.shared import Inches, Pt
 from fpdf import FPDF
 from pydantic import BaseModel, Field
 
+# Known CV section names, matched as whole words regardless of case. The PDF
+# layout recognises a shorter list than the DOCX one.
+_CV_SECTIONS = frozenset(
+    {
+        "EXPERIENCE",
+        "EDUCATION",
+        "SKILLS",
+        "SUMMARY",
+        "PROFILE",
+        "PROJECTS",
+        "CERTIFICATIONS",
+        "LANGUAGES",
+        "EXPERIENCIA",
+        "EDUCACIÓN",
+        "HABILIDADES",
+        "PERFIL",
+        "PROYECTOS",
+        "CERTIFICACIONES",
+        "IDIOMAS",
+    }
+)
+_CV_PDF_SECTIONS = frozenset(
+    {
+        "EXPERIENCE",
+        "EDUCATION",
+        "SKILLS",
+        "SUMMARY",
+        "PROFILE",
+        "PROJECTS",
+        "EXPERIENCIA",
+        "EDUCACIÓN",
+        "HABILIDADES",
+        "PERFIL",
+        "PROYECTOS",
+    }
+)
+# Punctuation that may surround a section name ("WORK EXPERIENCE:", "Skills/Tools")
+_CV_WORD_SEPARATORS = str.maketrans(dict.fromkeys(":#-|/&.,()", " "))
+
+
+def _is_cv_header(line: str, sections: frozenset[str]) -> bool:
+    """Detect section headers (all caps, starts with #, or known sections)."""
+    if line.isupper() or line.startswith("#"):
+        return True
+    upper = line.upper()
+    # A section word is also a substring, so only lines containing one get tokenised
+    for section in sections:
+        if section in upper:
+            return not sections.isdisjoint(upper.translate(_CV_WORD_SEPARATORS).split())
+    return False
+
+
+def _iter_split(text: str, sep: str) -> Iterator[str]:
+    """Yield the pieces of ``text.split(sep)`` without building the list."""
+    start = 0
+    while (end := text.find(sep, start)) != -1:
+        yield text[start:end]
+        start = end + len(sep)
+    yield text[start:]
+
+
+def _classify_cv_lines(content: str, sections: frozenset[str]) -> Iterator[tuple[str, str]]:
+    """Classify CV content line by line into (kind, text) pairs.
+
+    Kinds are "blank", "header", "bullet", "nested" and "para". Header text
+    has its leading # removed; other text is the stripped line, bullet
+    marker included.
+    """
+    for raw in _iter_split(content, "\n"):
+        line = raw.strip()
+        if not line:
+            yield "blank", ""
+        elif _is_cv_header(line, sections):
+            yield "header", line.lstrip("#").strip()
+        elif raw.startswith(("  - ", "  • ")):
+            yield "nested", line
+        elif line.startswith(("- ", "• ")):
+            yield "bullet", line
+        else:
+            yield "para", line
+
+
+@cache
+def _docx_template(vertical_margin: float, horizontal_margin: float) -> bytes:
+    """Serialized empty document with the given margins (in inches).
+
+    Loading this is cheaper than Document() plus setting margins on every call.
+    """
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = Inches(vertical_margin)
+        section.bottom_margin = Inches(vertical_margin)
+        section.left_margin = Inches(horizontal_margin)
+        section.right_margin = Inches(horizontal_margin)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
 
 class DocumentFormat(str, Enum):
     """Supported document formats."""
@@ -40,14 +140,12 @@ class DocumentGenerator:
     @staticmethod
     def generate_cv_docx(content: str, metadata: DocumentMetadata) -> bytes:
         """Generate a CV document in DOCX format."""
-        doc = Document()
+        return DocumentGenerator._cv_docx_buffer(content, metadata).getvalue()
 
-        # Set document margins
-        for section in doc.sections:
-            section.top_margin = Inches(0.75)
-            section.bottom_margin = Inches(0.75)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+    @staticmethod
+    def _cv_docx_buffer(content: str, metadata: DocumentMetadata) -> io.BytesIO:
+        """Generate a CV document in DOCX format into a buffer positioned at 0."""
+        doc = Document(io.BytesIO(_docx_template(0.75, 1)))
 
         # Add header if candidate name provided
         if metadata.candidate_name:
@@ -65,73 +163,37 @@ class DocumentGenerator:
         doc.add_paragraph()  # Spacing
 
         # Process content - split by common CV sections
-        lines = content.split("\n")
-        current_section = None
+        add_heading = doc.add_heading
+        add_paragraph = doc.add_paragraph
+        para_space_after = Pt(6)
 
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for kind, text in _classify_cv_lines(content, _CV_SECTIONS):
+            if kind == "blank":
                 continue
-
-            # Detect section headers (all caps, starts with #, or known sections)
-            is_header = (
-                line.isupper()
-                or line.startswith("#")
-                or any(
-                    section in line.upper()
-                    for section in [
-                        "EXPERIENCE",
-                        "EDUCATION",
-                        "SKILLS",
-                        "SUMMARY",
-                        "PROFILE",
-                        "PROJECTS",
-                        "CERTIFICATIONS",
-                        "LANGUAGES",
-                        "EXPERIENCIA",
-                        "EDUCACIÓN",
-                        "HABILIDADES",
-                        "PERFIL",
-                        "PROYECTOS",
-                        "CERTIFICACIONES",
-                        "IDIOMAS",
-                    ]
-                )
-            )
-
-            if is_header:
-                # Clean header text
-                header_text = line.lstrip("#").strip()
-                doc.add_heading(header_text, level=1)
-                current_section = header_text
-            elif line.startswith("- ") or line.startswith("• "):
-                # Bullet point
-                p = doc.add_paragraph(line[2:], style="List Bullet")
-            elif line.startswith("  - ") or line.startswith("  • "):
-                # Nested bullet
-                p = doc.add_paragraph(line[4:], style="List Bullet 2")
+            if kind == "header":
+                add_heading(text, level=1)
+            elif kind == "bullet":
+                add_paragraph(text[2:], style="List Bullet")
+            elif kind == "nested":
+                add_paragraph(text[2:], style="List Bullet 2")
             else:
                 # Regular paragraph
-                p = doc.add_paragraph(line)
-                p.paragraph_format.space_after = Pt(6)
+                add_paragraph(text).paragraph_format.space_after = para_space_after
 
-        # Save to bytes
         buffer = io.BytesIO()
         doc.save(buffer)
         buffer.seek(0)
-        return buffer.getvalue()
+        return buffer
 
     @staticmethod
     def generate_cover_letter_docx(content: str, metadata: DocumentMetadata) -> bytes:
         """Generate a cover letter document in DOCX format."""
-        doc = Document()
+        return DocumentGenerator._cover_letter_docx_buffer(content, metadata).getvalue()
 
-        # Set document margins
-        for section in doc.sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1.25)
-            section.right_margin = Inches(1.25)
+    @staticmethod
+    def _cover_letter_docx_buffer(content: str, metadata: DocumentMetadata) -> io.BytesIO:
+        """Generate a cover letter in DOCX format into a buffer positioned at 0."""
+        doc = Document(io.BytesIO(_docx_template(1, 1.25)))
 
         # Add date
         date_para = doc.add_paragraph(metadata.date)
@@ -148,8 +210,7 @@ class DocumentGenerator:
             doc.add_paragraph()
 
         # Add content paragraphs
-        paragraphs = content.split("\n\n")
-        for para_text in paragraphs:
+        for para_text in _iter_split(content, "\n\n"):
             para_text = para_text.strip()
             if para_text:
                 # Handle single line breaks within paragraphs
@@ -158,14 +219,13 @@ class DocumentGenerator:
                 p.paragraph_format.space_after = Pt(12)
                 p.paragraph_format.line_spacing = 1.15
 
-        # Save to bytes
         buffer = io.BytesIO()
         doc.save(buffer)
         buffer.seek(0)
-        return buffer.getvalue()
+        return buffer
 
     @staticmethod
-    def generate_cv_pdf(content: str, metadata: DocumentMetadata) -> bytes:
+    def generate_cv_pdf(content: str, metadata: DocumentMetadata) -> bytearray:
         """Generate a CV document in PDF format."""
         pdf = FPDF()
         pdf.add_page()
@@ -193,51 +253,51 @@ class DocumentGenerator:
 
         pdf.ln(5)
 
-        # Process content
-        pdf.set_font("Helvetica", size=10)
-        lines = content.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line:
+        # Process content. Font and left margin only change on transitions
+        # between headers, bullets and body text, not on every line.
+        body_font = ("Helvetica", "", 10)
+        header_font = ("Helvetica", "B", 12)
+        left_margin = pdf.l_margin
+        pdf.set_font(*body_font)
+        pdf.set_fill_color(240, 240, 240)
+        current_font = body_font
+        in_bullets = False
+
+        for kind, text in _classify_cv_lines(content, _CV_PDF_SECTIONS):
+            is_bullet = kind in ("bullet", "nested")
+            if is_bullet != in_bullets:
+                # Indent a run of bullets by moving the left margin once
+                pdf.set_left_margin(20 if is_bullet else left_margin)
+                pdf.set_x(pdf.l_margin)
+                in_bullets = is_bullet
+
+            if kind == "blank":
                 pdf.ln(3)
                 continue
 
-            # Detect section headers
-            is_header = line.isupper() or line.startswith("#") or any(
-                section in line.upper()
-                for section in [
-                    "EXPERIENCE",
-                    "EDUCATION",
-                    "SKILLS",
-                    "SUMMARY",
-                    "PROFILE",
-                    "PROJECTS",
-                    "EXPERIENCIA",
-                    "EDUCACIÓN",
-                    "HABILIDADES",
-                    "PERFIL",
-                    "PROYECTOS",
-                ]
-            )
+            font = header_font if kind == "header" else body_font
+            if font != current_font:
+                pdf.set_font(*font)
+                current_font = font
 
-            if is_header:
-                header_text = line.lstrip("#").strip()
+            if kind == "header":
                 pdf.ln(5)
-                pdf.set_font("Helvetica", "B", 12)
-                pdf.set_fill_color(240, 240, 240)
-                pdf.cell(0, 8, header_text, fill=True, new_x="LMARGIN", new_y="NEXT")
-                pdf.set_font("Helvetica", size=10)
-            elif line.startswith("- ") or line.startswith("• "):
-                pdf.set_x(20)
-                pdf.multi_cell(0, 6, f"  {line}")
+                pdf.cell(0, 8, text, fill=True, new_x="LMARGIN", new_y="NEXT")
+                continue
+
+            if is_bullet:
+                text = f"  {text}"
+            # Most CV lines fit on one line; a plain cell renders them the same
+            # without multi_cell's per-character line breaking
+            if pdf.get_string_width(text) + 2 * pdf.c_margin <= pdf.w - pdf.r_margin - pdf.x:
+                pdf.cell(0, 6, text, new_x="LMARGIN", new_y="NEXT")
             else:
-                pdf.multi_cell(0, 6, line)
+                pdf.multi_cell(0, 6, text, new_x="LMARGIN", new_y="NEXT")
 
-        return bytes(pdf.output())
+        return pdf.output()
 
     @staticmethod
-    def generate_cover_letter_pdf(content: str, metadata: DocumentMetadata) -> bytes:
+    def generate_cover_letter_pdf(content: str, metadata: DocumentMetadata) -> bytearray:
         """Generate a cover letter document in PDF format."""
         pdf = FPDF()
         pdf.add_page()
@@ -261,14 +321,13 @@ class DocumentGenerator:
 
         # Content
         pdf.set_font("Helvetica", size=11)
-        paragraphs = content.split("\n\n")
-        for para_text in paragraphs:
+        for para_text in _iter_split(content, "\n\n"):
             para_text = para_text.strip().replace("\n", " ")
             if para_text:
                 pdf.multi_cell(0, 7, para_text)
                 pdf.ln(5)
 
-        return bytes(pdf.output())
+        return pdf.output()
 
     def generate(
         self,
@@ -276,7 +335,7 @@ class DocumentGenerator:
         format: DocumentFormat,
         doc_type: DocumentType,
         metadata: DocumentMetadata | None = None,
-    ) -> bytes:
+    ) -> bytes | bytearray:
         """
         Generate a document in the specified format.
 
@@ -287,7 +346,8 @@ class DocumentGenerator:
             metadata: Optional metadata for headers/footers
 
         Returns:
-            Document as bytes
+            Document as bytes (DOCX) or bytearray (PDF, fpdf2's own buffer,
+            returned without copying)
         """
         metadata = metadata or DocumentMetadata()
 
@@ -301,3 +361,34 @@ class DocumentGenerator:
                 return self.generate_cover_letter_docx(content, metadata)
             else:
                 return self.generate_cover_letter_pdf(content, metadata)
+
+    def generate_stream(
+        self,
+        content: str,
+        format: DocumentFormat,
+        doc_type: DocumentType,
+        metadata: DocumentMetadata | None = None,
+    ) -> io.BytesIO:
+        """
+        Generate a document into a readable buffer, positioned at the start.
+
+        Meant to be read in chunks (e.g. by a StreamingResponse). DOCX output
+        is not copied out of the buffer it was saved to, so callers should
+        only call .getvalue() if they really need bytes.
+
+        Args:
+            content: The text content to include
+            format: Output format (docx or pdf)
+            doc_type: Type of document (cv or cover_letter)
+            metadata: Optional metadata for headers/footers
+
+        Returns:
+            Buffer holding the document
+        """
+        metadata = metadata or DocumentMetadata()
+
+        if format == DocumentFormat.DOCX:
+            if doc_type == DocumentType.CV:
+                return self._cv_docx_buffer(content, metadata)
+            return self._cover_letter_docx_buffer(content, metadata)
+        return io.BytesIO(self.generate(content, format, doc_type, metadata))
@@ -4,12 +4,20 @@ Orchestrates the full pipeline: email parsing -> job extraction -> CV adaptation
 -> cover letter generation -> application automation.
 """
 
+import asyncio
 import logging
+import re
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 from uuid import UUID
 
 from anthropic import Anthropic
+from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from google import genai
+from google.genai import types
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,16 +30,49 @@ from src.agents.cv_adapter import (
 from src.config import settings
 from src.db.models import Job, JobStatus, User
 from src.integrations.email.parser import ExtractedJob, parse_job_email
+from src.scraper.content_cleaner import strip_noise_markup
 
 logger = logging.getLogger(__name__)
 
+# Whitespace cleanup for _clean_email_html
+_RE_NL3 = re.compile(r"\n{3,}")
+_RE_SPACE2 = re.compile(r" {2,}")
+
+# Markup parsed per character of text kept. Alert emails are table layouts
+# with inline styles, so their markup-to-text ratio is high; this bound only
+# trims markup that could not fit in the text limit anyway.
+_EMAIL_HTML_CAP_RATIO = 20
+
+# Emails not worth a Gemini round trip when regex parsing found nothing:
+# bodies too short to hold a listing, and transactional mail. Only phrases
+# that never appear in job titles belong here ("Payment Systems Engineer").
+_MIN_GEMINI_BODY_LENGTH = 200
+_NON_JOB_SUBJECT_RE = re.compile(
+    r"\b(?:receipt|invoice|order confirmation|verification code)\b",
+    re.IGNORECASE,
+)
+
+
+def _should_try_gemini(body: str, subject: str) -> bool:
+    """Cheap pre-check for emails that may contain jobs the regex parser missed."""
+    if len(body) < _MIN_GEMINI_BODY_LENGTH:
+        return False
+    if "http" not in body and "<a" not in body.lower():
+        return False
+    return not _NON_JOB_SUBJECT_RE.search(subject or "")
+
 
 def _clean_email_html(html_content: str, max_length: int = 15000) -> str:
     """Simple HTML cleaning for email content using BeautifulSoup only."""
-    import re
-    from bs4 import BeautifulSoup
+    # Bound the parse: drop style/script blocks, then cut oversized markup
+    # before a closing tag rather than truncating only the extracted text
+    html_content = strip_noise_markup(html_content)
+    cap = max_length * _EMAIL_HTML_CAP_RATIO
+    if len(html_content) > cap:
+        cut = html_content.rfind("</", 0, cap)
+        html_content = html_content[: cut if cut > 0 else cap]
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, settings.html_parser)
 
     # Remove script, style, and other noise elements
     for tag in soup.find_all(["script", "style", "noscript", "iframe", "svg"]):
@@ -41,8 +82,8 @@ def _clean_email_html(html_content: str, max_length: int = 15000) -> str:
     text = soup.get_text(separator="\n", strip=True)
 
     # Clean up excessive whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r" {2,}", " ", text)
+    text = _RE_NL3.sub("\n\n", text)
+    text = _RE_SPACE2.sub(" ", text)
 
     # Truncate if needed
     if len(text) > max_length:
@@ -51,6 +92,46 @@ def _clean_email_html(html_content: str, max_length: int = 15000) -> str:
     return text.strip()
 
 
+class _GeminiJob(BaseModel):
+    """Job entry in Gemini's structured email-parsing output."""
+
+    # Nullable rather than defaulted: the Gemini API rejects schema defaults
+    title: str
+    company: str | None
+    location: str | None
+    job_url: str | None
+
+
+# JSON mode with a schema: the response is a bare JSON array of jobs, so no
+# markdown fences to strip and no tokens spent on them
+_EMAIL_JOBS_CONFIG = types.GenerateContentConfig(
+    temperature=0.1,
+    max_output_tokens=4096,
+    response_mime_type="application/json",
+    response_schema=list[_GeminiJob],
+)
+
+
+# Gemini models for email parsing, in preference order
+EMAIL_GEMINI_MODELS = ("gemini-2.0-flash", "gemini-1.5-flash")
+
+# Model that last answered without error; tried first so a failing primary
+# model doesn't cost a wasted round trip on every email
+_last_good_model: str | None = None
+
+# Scraped job descriptions by URL. Failures are not cached so they retry.
+JOB_DESCRIPTION_CACHE_TTL = 3600
+_job_description_cache: TTLCache[str, str] = TTLCache(
+    maxsize=512, ttl=JOB_DESCRIPTION_CACHE_TTL
+)
+
+
+@cache
+def _get_genai_client() -> genai.Client:
+    """Gemini client shared across emails (reuses its HTTP connection pool)."""
+    return genai.Client(api_key=settings.gemini_api_key)
+
+
 async def parse_email_with_gemini(
     body: str, subject: str, sender: str
 ) -> list[ExtractedJob]:
@@ -58,15 +139,14 @@ async def parse_email_with_gemini(
 
     Falls back to empty list if Gemini is not configured or fails.
     """
+    global _last_good_model
+
     if not settings.gemini_api_key:
         logger.warning("GEMINI_API_KEY not configured, skipping AI parsing")
         return []
 
     try:
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=settings.gemini_api_key)
+        client = _get_genai_client()
 
         # Clean HTML for better parsing (using simple BeautifulSoup-based cleaning)
         cleaned_body = _clean_email_html(body, max_length=15000)
@@ -88,54 +168,40 @@ For each job found, extract:
 Return a JSON array of jobs. Example:
 [{{"title": "Software Engineer", "company": "Google", "location": "London, UK", "job_url": "https://..."}}]
 
-If no jobs are found, return an empty array: []
-Only return valid JSON, no markdown or explanation."""
+If no jobs are found, return an empty array: []"""
 
-        # Try with available Gemini models
-        models = ["gemini-2.0-flash", "gemini-1.5-flash"]
+        # Try with available Gemini models, last working one first
+        models = list(EMAIL_GEMINI_MODELS)
+        if _last_good_model in models:
+            models.remove(_last_good_model)
+            models.insert(0, _last_good_model)
 
         for model_name in models:
             try:
                 response = await client.aio.models.generate_content(
                     model=model_name,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.1,
-                        max_output_tokens=4096,
-                    ),
+                    config=_EMAIL_JOBS_CONFIG,
                 )
+                _last_good_model = model_name
+
+                jobs_data: list[_GeminiJob] = response.parsed or []
+                source_platform = "linkedin" if "linkedin" in sender.lower() else "email"
+                extracted = [
+                    ExtractedJob(
+                        title=job.title,
+                        company=job.company or "Unknown",
+                        location=job.location,
+                        job_url=job.job_url,
+                        source_platform=source_platform,
+                    )
+                    for job in jobs_data
+                    if job.title
+                ]
 
-                if response.text:
-                    import json
-                    # Clean response
-                    text = response.text.strip()
-                    if text.startswith("```json"):
-                        text = text[7:]
-                    if text.startswith("```"):
-                        text = text[3:]
-                    if text.endswith("```"):
-                        text = text[:-3]
-                    text = text.strip()
-
-                    jobs_data = json.loads(text)
-
-                    if not isinstance(jobs_data, list):
-                        jobs_data = [jobs_data]
-
-                    extracted = []
-                    for job in jobs_data:
-                        if job.get("title"):
-                            extracted.append(ExtractedJob(
-                                title=job.get("title", ""),
-                                company=job.get("company", "Unknown"),
-                                location=job.get("location"),
-                                job_url=job.get("job_url"),
-                                source_platform="linkedin" if "linkedin" in sender.lower() else "email",
-                            ))
-
-                    if extracted:
-                        logger.info(f"Gemini extracted {len(extracted)} jobs from email")
-                        return extracted
+                if extracted:
+                    logger.info(f"Gemini extracted {len(extracted)} jobs from email")
+                    return extracted
 
             except Exception as e:
                 logger.warning(f"Gemini model {model_name} failed: {e}")
@@ -148,11 +214,33 @@ Only return valid JSON, no markdown or explanation."""
         return []
 
 
+async def _scrape_job_description(job_url: str) -> str | None:
+    """Scrape a job posting for its description; None if scraping fails.
+
+    Successful scrapes are cached by URL, so reprocessed or retried emails
+    skip the fetch and the extraction LLM call.
+    """
+    if (cached := _job_description_cache.get(job_url)) is not None:
+        return cached
+    try:
+        from src.integrations.jobs.scraper import scrape_job_url
+
+        scraped = await scrape_job_url(job_url)
+        if scraped.success and scraped.description:
+            _job_description_cache[job_url] = scraped.description
+            return scraped.description
+        logger.warning(f"Could not scrape job URL: {scraped.error}")
+    except Exception as e:
+        logger.warning(f"Could not scrape job URL: {e}")
+    return None
+
+
 @dataclass
 class PipelineOptions:
     """Options for controlling the email processing pipeline."""
 
     save_job: bool = True
+    save_all_jobs: bool = False  # Save every extracted job, not just the selected one
     adapt_cv: bool = False
     generate_cover_letter: bool = False
     start_application: bool = False
@@ -284,9 +372,14 @@ class EmailPipelineService:
 
             # If regex fails, try Gemini AI parsing
             if not extracted_jobs:
-                logger.info("Regex parsing found no jobs, trying Gemini AI...")
-                extracted_jobs = await parse_email_with_gemini(body, subject, sender)
+                if _should_try_gemini(body, subject):
+                    logger.info("Regex parsing found no jobs, trying Gemini AI...")
+                    extracted_jobs = await parse_email_with_gemini(body, subject, sender)
+                else:
+                    logger.debug("Skipping Gemini: email unlikely to contain jobs")
 
+            # Plain dict literals: dataclasses.asdict deep-copies recursively and
+            # is ~40x slower for this flat five-field record
             result.jobs_extracted = [
                 {
                     "title": j.title,
@@ -316,21 +409,40 @@ class EmailPipelineService:
         result.job_company = job.company
         result.job_url = job.job_url
 
-        # Step 2: Save job to database if requested
-        if options.save_job and job.job_url:
+        # Step 2: Save job(s) to database if requested
+        if options.save_all_jobs:
+            try:
+                job_ids, existing_urls = await self._save_jobs(
+                    extracted_jobs, user_id, email_content.get("message_id")
+                )
+                result.job_id = job_ids.get(job.job_url) if job.job_url else None
+                if job.job_url in existing_urls:
+                    errors.append(f"Job already exists: {result.job_id}")
+                logger.info(
+                    f"Saved {len(job_ids) - len(existing_urls)} new jobs "
+                    f"({len(existing_urls)} already existed)"
+                )
+
+            except Exception as e:
+                logger.exception(f"Error saving jobs to database: {e}")
+                errors.append(f"Failed to save jobs: {str(e)}")
+
+        elif options.save_job and job.job_url:
             try:
-                # Check for duplicates
+                # Check for duplicates (id only, no ORM object to hydrate)
                 existing = await self.db.execute(
-                    select(Job).where(
+                    select(Job.id)
+                    .where(
                         Job.user_id == user_id,
                         Job.source_url == job.job_url,
                     )
+                    .limit(1)
                 )
-                existing_job = existing.scalar_one_or_none()
+                existing_id = existing.scalar_one_or_none()
 
-                if existing_job:
-                    result.job_id = existing_job.id
-                    errors.append(f"Job already exists: {existing_job.id}")
+                if existing_id:
+                    result.job_id = existing_id
+                    errors.append(f"Job already exists: {existing_id}")
                 else:
                     db_job = Job(
                         user_id=user_id,
@@ -400,6 +512,61 @@ class EmailPipelineService:
 
         return result
 
+    async def _save_jobs(
+        self,
+        jobs: list[ExtractedJob],
+        user_id: UUID,
+        source_email_id: str | None,
+    ) -> tuple[dict[str, UUID], set[str]]:
+        """Save extracted jobs with one duplicate query and one flush.
+
+        Jobs without a URL are skipped, as are repeated URLs within the batch.
+
+        Args:
+            jobs: Jobs extracted from the email
+            user_id: Owner of the jobs
+            source_email_id: Message ID of the source email
+
+        Returns:
+            Job IDs by URL (new and existing), and the URLs that already existed
+        """
+        jobs_by_url: dict[str, ExtractedJob] = {}
+        for extracted in jobs:
+            if extracted.job_url:
+                jobs_by_url.setdefault(extracted.job_url, extracted)
+        if not jobs_by_url:
+            return {}, set()
+
+        existing = await self.db.execute(
+            select(Job.source_url, Job.id).where(
+                Job.user_id == user_id,
+                Job.source_url.in_(jobs_by_url),
+            )
+        )
+        job_ids: dict[str, UUID] = dict(existing.tuples().all())
+        existing_urls = set(job_ids)
+
+        new_jobs = [
+            Job(
+                user_id=user_id,
+                source_url=url,
+                title=extracted.title,
+                company=extracted.company,
+                location=extracted.location,
+                source_platform=extracted.source_platform,
+                source_email_id=source_email_id,
+                status=JobStatus.INBOX,
+            )
+            for url, extracted in jobs_by_url.items()
+            if url not in existing_urls
+        ]
+        if new_jobs:
+            self.db.add_all(new_jobs)
+            await self.db.flush()
+            job_ids.update((db_job.source_url, db_job.id) for db_job in new_jobs)
+
+        return job_ids, existing_urls
+
     async def _adapt_cv(
         self,
         user_id: UUID,
@@ -424,24 +591,24 @@ class EmailPipelineService:
         Returns:
             Dictionary with adapted_cv, cover_letter, match_score, etc.
         """
-        # Get user's base CV
-        user_result = await self.db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
-
-        if not user or not user.base_cv_content:
-            raise ValueError("User has no base CV configured")
-
-        # Get job description if not provided
+        # Scrape the job description (if not provided) while the base CV loads
+        scrape_task = None
         if not job_description and job_url:
-            # Try to scrape job description
-            try:
-                from src.integrations.jobs.scraper import scrape_job_url
+            scrape_task = asyncio.create_task(_scrape_job_description(job_url))
 
-                scraped = await scrape_job_url(job_url)
-                if scraped:
-                    job_description = scraped.get("description", "")
-            except Exception as e:
-                logger.warning(f"Could not scrape job URL: {e}")
+        try:
+            # Get user's base CV
+            user_result = await self.db.execute(select(User).where(User.id == user_id))
+            user = user_result.scalar_one_or_none()
+
+            if not user or not user.base_cv_content:
+                raise ValueError("User has no base CV configured")
+
+            if scrape_task:
+                job_description = await scrape_task
+        finally:
+            if scrape_task:
+                scrape_task.cancel()  # No-op once finished
 
         # If still no description, use minimal info
         if not job_description:
@@ -1,14 +1,43 @@
 """Pytest configuration and fixtures."""
 
 import os
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
 from anthropic import Anthropic
 
-# Set test environment
+# Set test environment. This must run at import time: src.config builds its
+# settings when first imported, which happens while tests are collected.
+# Each pytest-xdist worker gets its own SQLite file to avoid write contention.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+_db_suffix = f"_{_xdist_worker}" if _xdist_worker else ""
 os.environ["APP_ENV"] = "development"
-os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test_data/test.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///./test_data/test{_db_suffix}.db"
+
+
+@dataclass(slots=True)
+class _TextBlock:
+    """Stand-in for an Anthropic text content block."""
+
+    text: str
+    type: str = "text"
+
+
+@dataclass(slots=True)
+class _Usage:
+    """Stand-in for Anthropic token usage."""
+
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass(slots=True)
+class _Response:
+    """Stand-in for an Anthropic message response (only read, never asserted on)."""
+
+    content: list[_TextBlock]
+    usage: _Usage
 
 
 @pytest.fixture
@@ -16,27 +45,21 @@ def mock_anthropic_response():
     """Create a mock Anthropic API response."""
 
     def _create_response(text: str, input_tokens: int = 100, output_tokens: int = 200):
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(type="text", text=text)]
-        mock_response.usage = MagicMock(
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-        )
-        return mock_response
+        return _Response(content=[_TextBlock(text=text)], usage=_Usage(input_tokens, output_tokens))
 
     return _create_response
 
 
 @pytest.fixture
-def mock_claude_client(mock_anthropic_response):
-    """Create a mock Claude client."""
+def mock_claude_client():
+    """Create a mock Claude client; the real Anthropic class is restored after the test."""
     with patch("src.integrations.claude.client.Anthropic") as mock_class:
         mock_client = MagicMock(spec=Anthropic)
         mock_class.return_value = mock_client
         yield mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cv():
     """Sample CV content for testing."""
     return """
@@ -71,7 +94,7 @@ PhD in Mathematics with focus on optimization algorithms.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_description():
     """Sample job description for testing."""
     return """
@@ -102,10 +125,11 @@ We're looking for an AI Engineer to build next-generation conversational AI syst
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cv_adapter_output_json():
     """Expected JSON output from CV adapter."""
     return """{
+    "detected_language": "en",
     "adapted_cv": "# Javier Aguilar Martín\\n\\n**AI & ML Engineer specialized in Conversational AI**...",
     "match_score": 85,
     "changes_made": [
@@ -129,3 +153,12 @@ def cv_adapter_output_json():
         "RAG pipeline experience aligns with their tech stack"
     ]
 }"""
+
+
+@pytest.fixture(scope="session")
+def cv_adapter_output_parsed(cv_adapter_output_json):
+    """CV adapter output parsed once; tests must treat it as read-only."""
+    # Imported here so settings load after the test environment is set
+    from src.agents.cv_adapter import CVAdapterOutput
+
+    return CVAdapterOutput.model_validate_json(cv_adapter_output_json)
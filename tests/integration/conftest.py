@@ -0,0 +1,33 @@
+"""Fixtures for integration tests against a running API server."""
+
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+
+BASE_URL = "http://localhost:8000"
+SHORT_TIMEOUT = httpx.Timeout(10.0)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live tests unless explicitly opted in; they act on third-party sites."""
+    if os.environ.get("RUN_LIVE_TESTS") == "1":
+        return
+    skip_live = pytest.mark.skip(reason="live test: set RUN_LIVE_TESTS=1 to run")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """Client shared by all integration tests; skips them if no server is running."""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, follow_redirects=True, timeout=SHORT_TIMEOUT
+    ) as client:
+        try:
+            await client.get("/health")
+        except httpx.TransportError:
+            pytest.skip(f"API server not running at {BASE_URL}")
+        yield client
@@ -0,0 +1,11 @@
+"""Fixtures shared by unit tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Settings built once from the test environment; treat as read-only."""
+    from src.config import Settings
+
+    return Settings()
@@ -1,6 +1,6 @@
 """Unit tests for agents."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,6 +13,25 @@ from src.agents.cv_adapter import (
     CVAdapterOutput,
 )
 
+# CVAdapterOutput fields other than match_score, for the bounds tests
+_CV_OUTPUT_FIELDS = {
+    "detected_language": "en",
+    "adapted_cv": "test",
+    "changes_made": [],
+    "skills_matched": [],
+    "skills_missing": [],
+    "key_highlights": [],
+}
+
+
+@pytest.fixture(autouse=True)
+def claude_client(monkeypatch):
+    """Stub the Claude client and Langfuse tracing for every agent test."""
+    client = MagicMock()
+    monkeypatch.setattr("src.agents.base.get_claude_client", lambda *args, **kwargs: client)
+    monkeypatch.setattr("src.agents.base.langfuse_context", MagicMock())
+    return client
+
 
 class TestCVAdapterAgent:
     """Tests for CV Adapter Agent."""
@@ -20,77 +39,65 @@ class TestCVAdapterAgent:
     @pytest.mark.asyncio
     async def test_cv_adapter_properties(self):
         """Test agent properties."""
-        with patch("src.agents.base.get_claude_client"):
-            agent = CVAdapterAgent(claude_api_key="test-key")
+        agent = CVAdapterAgent(claude_api_key="test-key")
 
         assert agent.name == "cv-adapter"
         assert "CV optimization" in agent.system_prompt
 
     @pytest.mark.asyncio
-    async def test_cv_adapter_input_validation(self, sample_cv, sample_job_description):
-        """Test input model validation."""
+    @pytest.mark.parametrize("language", ["en", "es"])
+    async def test_cv_adapter_input_validation(self, language, sample_cv, sample_job_description):
+        """Test input model validation for each supported language."""
         input_data = CVAdapterInput(
             base_cv=sample_cv,
             job_description=sample_job_description,
             job_title="AI Engineer",
             company="SOULCHI",
-            language="en",
+            language=language,
         )
 
         assert input_data.base_cv == sample_cv
-        assert input_data.language == "en"
+        assert input_data.language == language
 
     @pytest.mark.asyncio
-    async def test_cv_adapter_output_validation(self, cv_adapter_output_json):
+    async def test_cv_adapter_output_validation(self, cv_adapter_output_parsed):
         """Test output model validation."""
-        output = CVAdapterOutput.model_validate_json(cv_adapter_output_json)
+        output = cv_adapter_output_parsed
 
+        assert output.detected_language == "en"
         assert output.match_score == 85
         assert len(output.changes_made) == 3
         assert "Python" in output.skills_matched
         assert len(output.key_highlights) == 3
 
     @pytest.mark.asyncio
-    async def test_cv_adapter_run(self, sample_cv, sample_job_description, cv_adapter_output_json):
+    async def test_cv_adapter_run(
+        self,
+        claude_client,
+        mock_anthropic_response,
+        sample_cv,
+        sample_job_description,
+        cv_adapter_output_json,
+        cv_adapter_output_parsed,
+    ):
         """Test full CV adaptation run with mocked Claude."""
-        with patch("src.agents.base.get_claude_client") as mock_get_client:
-            # Setup mock
-            mock_client = MagicMock()
-            mock_response = MagicMock()
-            mock_response.content = [MagicMock(type="text", text=cv_adapter_output_json)]
-            mock_response.usage = MagicMock(input_tokens=500, output_tokens=800)
-            mock_client.messages.create.return_value = mock_response
-            mock_get_client.return_value = mock_client
-
-            # Run agent
-            agent = CVAdapterAgent(claude_api_key="test-key")
-            input_data = CVAdapterInput(
-                base_cv=sample_cv,
-                job_description=sample_job_description,
-                job_title="AI Engineer",
-                company="SOULCHI",
-            )
-
-            # Patch the langfuse context to avoid tracing during tests
-            with patch("src.agents.base.langfuse_context"):
-                result = await agent.run(input_data)
-
-            assert isinstance(result, CVAdapterOutput)
-            assert result.match_score == 85
-            assert "Python" in result.skills_matched
+        # The agent calls the sync Anthropic client, so create is a plain mock
+        claude_client.messages.create.return_value = mock_anthropic_response(
+            cv_adapter_output_json, input_tokens=500, output_tokens=800
+        )
 
-    @pytest.mark.asyncio
-    async def test_cv_adapter_language_spanish(self):
-        """Test CV adaptation with Spanish language."""
+        # Run agent
+        agent = CVAdapterAgent(claude_api_key="test-key")
         input_data = CVAdapterInput(
-            base_cv="CV en español...",
-            job_description="Descripción del puesto...",
-            job_title="Ingeniero de IA",
-            company="Empresa",
-            language="es",
+            base_cv=sample_cv,
+            job_description=sample_job_description,
+            job_title="AI Engineer",
+            company="SOULCHI",
         )
+        result = await agent.run(input_data)
 
-        assert input_data.language == "es"
+        assert result == cv_adapter_output_parsed
+        claude_client.messages.create.assert_called_once()
 
 
 class TestCoverLetterAgent:
@@ -99,8 +106,7 @@ class TestCoverLetterAgent:
     @pytest.mark.asyncio
     async def test_cover_letter_properties(self):
         """Test agent properties."""
-        with patch("src.agents.base.get_claude_client"):
-            agent = CoverLetterAgent(claude_api_key="test-key")
+        agent = CoverLetterAgent(claude_api_key="test-key")
 
         assert agent.name == "cover-letter"
         assert "cover letter" in agent.system_prompt.lower()
@@ -139,58 +145,15 @@ class TestCoverLetterAgent:
 class TestCVAdapterOutputModel:
     """Tests for CVAdapterOutput Pydantic model."""
 
-    def test_match_score_validation(self):
-        """Test match score bounds."""
-        # Valid scores
-        output = CVAdapterOutput(
-            adapted_cv="test",
-            match_score=85,
-            changes_made=[],
-            skills_matched=[],
-            skills_missing=[],
-            key_highlights=[],
-        )
-        assert output.match_score == 85
+    @pytest.mark.parametrize("score", [85, 0, 100])
+    def test_match_score_validation(self, score):
+        """Test match score accepts values within bounds."""
+        output = CVAdapterOutput(match_score=score, **_CV_OUTPUT_FIELDS)
 
-        # Boundary values
-        output_min = CVAdapterOutput(
-            adapted_cv="test",
-            match_score=0,
-            changes_made=[],
-            skills_matched=[],
-            skills_missing=[],
-            key_highlights=[],
-        )
-        assert output_min.match_score == 0
-
-        output_max = CVAdapterOutput(
-            adapted_cv="test",
-            match_score=100,
-            changes_made=[],
-            skills_matched=[],
-            skills_missing=[],
-            key_highlights=[],
-        )
-        assert output_max.match_score == 100
+        assert output.match_score == score
 
-    def test_match_score_out_of_bounds(self):
+    @pytest.mark.parametrize("score", [101, -1])
+    def test_match_score_out_of_bounds(self, score):
         """Test match score rejects out of bounds values."""
         with pytest.raises(ValueError):
-            CVAdapterOutput(
-                adapted_cv="test",
-                match_score=101,  # Over 100
-                changes_made=[],
-                skills_matched=[],
-                skills_missing=[],
-                key_highlights=[],
-            )
-
-        with pytest.raises(ValueError):
-            CVAdapterOutput(
-                adapted_cv="test",
-                match_score=-1,  # Below 0
-                changes_made=[],
-                skills_matched=[],
-                skills_missing=[],
-                key_highlights=[],
-            )
+            CVAdapterOutput(match_score=score, **_CV_OUTPUT_FIELDS)
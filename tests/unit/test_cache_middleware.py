@@ -0,0 +1,112 @@
+"""Tests for the GET response cache middleware."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.middleware import CacheMiddleware
+
+
+class _CountingApp:
+    """ASGI app answering every request with a per-path call counter."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, scope, receive, send) -> None:
+        path = scope["path"]
+        self.calls[path] = self.calls.get(path, 0) + 1
+        body = f"{path}?{scope['query_string'].decode()} #{self.calls[path]}".encode()
+        if scope["method"] == "GET" and self.gate is not None:
+            await self.gate.wait()
+        status = 404 if path.endswith("/missing") else 200
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+
+@pytest.fixture
+def inner_app():
+    """Fresh counting app per test."""
+    return _CountingApp()
+
+
+@pytest.fixture
+async def client(inner_app):
+    """HTTP client talking to the cached app in-process."""
+    app = CacheMiddleware(
+        inner_app, invalidate_prefixes=("/api/jobs", "/api/gmail", "/api/emails")
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestCacheMiddleware:
+    """Tests for CacheMiddleware."""
+
+    async def test_repeated_get_is_served_from_cache(self, client, inner_app):
+        """Test that a second identical GET does not reach the app."""
+        first = await client.get("/api/jobs/", params={"page": 1})
+        second = await client.get("/api/jobs/", params={"page": 1})
+
+        assert second.text == first.text == "/api/jobs/?page=1 #1"
+        assert inner_app.calls == {"/api/jobs/": 1}
+
+    async def test_misses(self, client, inner_app):
+        """Test that other queries, uncached paths and errors reach the app."""
+        await client.get("/api/jobs/", params={"page": 1})
+        await client.get("/api/jobs/", params={"page": 2})
+        await client.get("/api/users/me")
+        await client.get("/api/users/me")
+        await client.get("/api/jobs/missing")
+        await client.get("/api/jobs/missing")
+
+        assert inner_app.calls == {"/api/jobs/": 2, "/api/users/me": 2, "/api/jobs/missing": 2}
+
+    async def test_entries_are_per_authorization(self, client, inner_app):
+        """Test that a response is only replayed to the same credentials."""
+        alice = await client.get("/api/jobs/", headers={"Authorization": "Bearer alice"})
+        bob = await client.get("/api/jobs/", headers={"Authorization": "Bearer bob"})
+        alice_again = await client.get("/api/jobs/", headers={"Authorization": "Bearer alice"})
+
+        assert (alice.text, bob.text, alice_again.text) == (
+            "/api/jobs/? #1",
+            "/api/jobs/? #2",
+            "/api/jobs/? #1",
+        )
+
+    @pytest.mark.parametrize(
+        "write_path", ["/api/jobs/123", "/api/gmail/scan/u1", "/api/emails/ingest"]
+    )
+    async def test_writes_invalidate(self, client, inner_app, write_path):
+        """Test that writes to any job-mutating prefix clear cached lists."""
+        await client.get("/api/jobs/")
+        await client.post(write_path)
+        refreshed = await client.get("/api/jobs/")
+
+        assert refreshed.text == "/api/jobs/? #2"
+
+    async def test_other_writes_keep_cache(self, client, inner_app):
+        """Test that writes outside the invalidating prefixes leave the cache alone."""
+        await client.get("/api/jobs/")
+        await client.post("/api/auth/login")
+        cached = await client.get("/api/jobs/")
+
+        assert cached.text == "/api/jobs/? #1"
+
+    async def test_get_overlapping_a_write_is_not_stored(self, client, inner_app):
+        """Test that a GET started before a write cannot re-insert stale data."""
+        inner_app.gate = asyncio.Event()
+        stale_get = asyncio.create_task(client.get("/api/jobs/"))
+        while "/api/jobs/" not in inner_app.calls:
+            await asyncio.sleep(0)
+
+        await client.post("/api/emails/ingest")
+        inner_app.gate.set()
+        stale = await stale_get
+        fresh = await client.get("/api/jobs/")
+
+        assert stale.text == "/api/jobs/? #1"
+        assert fresh.text == "/api/jobs/? #2"
@@ -0,0 +1,157 @@
+"""Tests for the Chrome DevTools MCP client snapshot uid cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.mcp.chrome_client import ChromeDevToolsMCP
+
+SNAPSHOT_TEXT = 'uid=1_1 button "Apply"\nuid=1_2 link "Home"'
+RERENDERED_SNAPSHOT_TEXT = 'uid=2_1 button "Apply"\nuid=2_2 link "Home"'
+
+
+def _tool_result(text: str) -> SimpleNamespace:
+    """Build an MCP CallToolResult-like object with a single text block."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _evaluate_result(value: str | None) -> SimpleNamespace:
+    """Build an evaluate_script result wrapping value in a json fence."""
+    encoded = "null" if value is None else f'"{value}"'
+    return _tool_result(f"Script ran on page and returned:\n```json\n{encoded}\n```")
+
+
+@pytest.fixture
+def chrome():
+    """Client whose MCP calls are answered by call_tool.side_effect."""
+    client = ChromeDevToolsMCP()
+    client.call_tool = AsyncMock()
+    return client
+
+
+def _tool_names(chrome) -> list[str]:
+    """Names of the MCP tools called so far, in order."""
+    return [call.args[0] for call in chrome.call_tool.await_args_list]
+
+
+class TestSnapshotUidCache:
+    """Tests for click_by_role reusing snapshot uids."""
+
+    async def test_snapshot_takes_no_fingerprint(self, chrome):
+        """Test that a plain snapshot makes a single MCP call."""
+        chrome.call_tool.side_effect = [_tool_result(SNAPSHOT_TEXT)]
+
+        await chrome.take_snapshot()
+
+        assert _tool_names(chrome) == ["take_snapshot"]
+
+    async def test_click_by_role_reuses_unchanged_snapshot(self, chrome):
+        """Test that uids are reused while the stamped DOM is unchanged."""
+        chrome.call_tool.side_effect = [
+            _tool_result(SNAPSHOT_TEXT),
+            _evaluate_result("https://jobs.example.com|42"),  # stamp
+            _tool_result("clicked"),
+            _evaluate_result("https://jobs.example.com|42"),  # check after click
+            _tool_result("clicked"),
+        ]
+
+        await chrome.take_snapshot()
+        await chrome.click_by_role("button", "Apply")
+        await chrome.click_by_role("link", "Home")
+
+        assert _tool_names(chrome) == [
+            "take_snapshot",
+            "evaluate_script",
+            "click",
+            "evaluate_script",
+            "click",
+        ]
+        stamp_script = chrome.call_tool.await_args_list[1].args[1]["function"]
+        assert "__jobHunterSnapshot = 1" in stamp_script
+        assert chrome.call_tool.await_args_list[4].args[1] == {"uid": "1_2"}
+
+    async def test_click_by_role_resnapshots_after_rerender(self, chrome):
+        """Test that a re-render after a click drops the cached uids."""
+        chrome.call_tool.side_effect = [
+            _tool_result(SNAPSHOT_TEXT),
+            _evaluate_result("https://jobs.example.com|42"),  # stamp
+            _tool_result("clicked"),
+            _evaluate_result(None),  # unstamped elements: nodes were replaced
+            _tool_result(RERENDERED_SNAPSHOT_TEXT),
+            _tool_result("clicked"),
+        ]
+
+        await chrome.take_snapshot()
+        await chrome.click_by_role("button", "Apply")
+        await chrome.click_by_role("button", "Apply")
+
+        assert _tool_names(chrome) == [
+            "take_snapshot",
+            "evaluate_script",
+            "click",
+            "evaluate_script",
+            "take_snapshot",
+            "click",
+        ]
+        assert chrome.call_tool.await_args_list[-1].args[1] == {"uid": "2_1"}
+
+    async def test_unstamped_cache_is_dropped_after_click(self, chrome):
+        """Test that uids are not trusted after a click if the DOM was never stamped."""
+        chrome.call_tool.side_effect = [
+            _tool_result(SNAPSHOT_TEXT),
+            _tool_result("clicked"),
+            _tool_result(RERENDERED_SNAPSHOT_TEXT),
+            _tool_result("clicked"),
+        ]
+
+        await chrome.take_snapshot()
+        await chrome.click("1_2")
+        await chrome.click_by_role("button", "Apply")
+
+        assert _tool_names(chrome) == ["take_snapshot", "click", "take_snapshot", "click"]
+        assert chrome.call_tool.await_args_list[-1].args[1] == {"uid": "2_1"}
+
+    async def test_page_switch_drops_cache(self, chrome):
+        """Test that switching tabs drops uids without checking the new page's DOM."""
+        chrome.call_tool.side_effect = [
+            _tool_result(SNAPSHOT_TEXT),
+            _tool_result("selected"),
+            _tool_result(RERENDERED_SNAPSHOT_TEXT),
+            _tool_result("clicked"),
+        ]
+
+        await chrome.take_snapshot()
+        await chrome.select_page("2")
+        await chrome.click_by_role("button", "Apply")
+
+        assert _tool_names(chrome) == ["take_snapshot", "select_page", "take_snapshot", "click"]
+        assert chrome.call_tool.await_args_list[-1].args[1] == {"uid": "2_1"}
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("press_key", ("Enter",)),
+            ("fill_form", ([{"uid": "1_3", "value": "x"}],)),
+            ("hover", ("1_1",)),
+            ("drag", ("1_1", "1_2")),
+            ("upload_file", ("1_3", "/tmp/cv.pdf")),
+            ("handle_dialog", (True,)),
+            ("evaluate", ("() => 1",)),
+        ],
+    )
+    async def test_mutating_tools_mark_cache_dirty(self, chrome, method, args):
+        """Test that any page-changing tool forces a re-check before reusing uids."""
+        chrome.call_tool.side_effect = [
+            _tool_result(SNAPSHOT_TEXT),
+            _tool_result("done"),
+            _tool_result(RERENDERED_SNAPSHOT_TEXT),
+            _tool_result("clicked"),
+        ]
+
+        await chrome.take_snapshot()
+        await getattr(chrome, method)(*args)
+        await chrome.click_by_role("button", "Apply")
+
+        assert _tool_names(chrome)[2:] == ["take_snapshot", "click"]
+        assert chrome.call_tool.await_args_list[-1].args[1] == {"uid": "2_1"}
@@ -1,18 +1,39 @@
 """Tests for configuration."""
 
 import os
+from functools import lru_cache
 from unittest.mock import patch
 
+import pytest
+
 from src.config import Environment, Settings
 
+# (member, value) pairs checked in both directions by the enum tests
+_ENVIRONMENT_VALUES = [
+    (Environment.DEVELOPMENT, "development"),
+    (Environment.STAGING, "staging"),
+    (Environment.PRODUCTION, "production"),
+]
+
+
+@lru_cache
+def _settings_for(env_items: frozenset[tuple[str, str]]) -> Settings:
+    """Build Settings from exactly these environment variables."""
+    with patch.dict(os.environ, dict(env_items), clear=True):
+        return Settings()
+
+
+def _settings(**env: str) -> Settings:
+    """Settings for an environment; identical environments share one instance."""
+    return _settings_for(frozenset(env.items()))
+
 
 class TestSettings:
     """Tests for Settings class."""
 
     def test_default_values(self):
         """Test default configuration values."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = Settings()
+        settings = _settings()
 
         assert settings.app_env == Environment.DEVELOPMENT
         assert settings.debug is True
@@ -22,14 +43,7 @@ class TestSettings:
 
     def test_environment_override(self):
         """Test environment variable overrides."""
-        env_vars = {
-            "APP_ENV": "production",
-            "DEBUG": "false",
-            "MAX_APPLICATIONS_PER_DAY": "20",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            settings = Settings()
+        settings = _settings(APP_ENV="production", DEBUG="false", MAX_APPLICATIONS_PER_DAY="20")
 
         assert settings.app_env == Environment.PRODUCTION
         assert settings.debug is False
@@ -37,41 +51,27 @@ class TestSettings:
 
     def test_is_production_property(self):
         """Test is_production property."""
-        with patch.dict(os.environ, {"APP_ENV": "production"}, clear=True):
-            settings = Settings()
-            assert settings.is_production is True
-
-        with patch.dict(os.environ, {"APP_ENV": "development"}, clear=True):
-            settings = Settings()
-            assert settings.is_production is False
+        assert _settings(APP_ENV="production").is_production is True
+        assert _settings(APP_ENV="development").is_production is False
 
     def test_is_development_property(self):
         """Test is_development property."""
-        with patch.dict(os.environ, {"APP_ENV": "development"}, clear=True):
-            settings = Settings()
-            assert settings.is_development is True
-
-        with patch.dict(os.environ, {"APP_ENV": "production"}, clear=True):
-            settings = Settings()
-            assert settings.is_development is False
+        assert _settings(APP_ENV="development").is_development is True
+        assert _settings(APP_ENV="production").is_development is False
 
     def test_database_url_default(self):
         """Test default database URL."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = Settings()
+        settings = _settings()
 
         assert "sqlite" in settings.database_url
 
     def test_langfuse_configuration(self):
         """Test Langfuse configuration."""
-        env_vars = {
-            "LANGFUSE_SECRET_KEY": "sk-lf-test",
-            "LANGFUSE_PUBLIC_KEY": "pk-lf-test",
-            "LANGFUSE_BASE_URL": "https://custom.langfuse.com",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            settings = Settings()
+        settings = _settings(
+            LANGFUSE_SECRET_KEY="sk-lf-test",
+            LANGFUSE_PUBLIC_KEY="pk-lf-test",
+            LANGFUSE_BASE_URL="https://custom.langfuse.com",
+        )
 
         assert settings.langfuse_secret_key == "sk-lf-test"
         assert settings.langfuse_public_key == "pk-lf-test"
@@ -81,13 +81,12 @@ class TestSettings:
 class TestEnvironmentEnum:
     """Tests for Environment enum."""
 
-    def test_environment_values(self):
+    @pytest.mark.parametrize("member,value", _ENVIRONMENT_VALUES)
+    def test_environment_values(self, member, value):
         """Test environment enum values."""
-        assert Environment.DEVELOPMENT.value == "development"
-        assert Environment.STAGING.value == "staging"
-        assert Environment.PRODUCTION.value == "production"
+        assert member.value == value
 
-    def test_environment_from_string(self):
+    @pytest.mark.parametrize("member,value", _ENVIRONMENT_VALUES)
+    def test_environment_from_string(self, member, value):
         """Test creating environment from string."""
-        assert Environment("development") == Environment.DEVELOPMENT
-        assert Environment("production") == Environment.PRODUCTION
+        assert Environment(value) is member
@@ -0,0 +1,156 @@
+"""Tests for HTML content cleaning."""
+
+from bs4 import BeautifulSoup
+
+from src.scraper.content_cleaner import (
+    HARD_HTML_CAP,
+    _cap_html,
+    _html_to_text,
+    _postprocess_text,
+    _remove_noise_elements,
+    clean_html_for_extraction,
+    parse_jobposting_ld,
+    strip_noise_markup,
+)
+
+
+class TestStripNoiseMarkup:
+    """Tests for pre-parse noise stripping."""
+
+    def test_removes_scripts_styles_and_svg(self):
+        """Test that script, style and svg blocks are dropped."""
+        html = (
+            "<head><script>var a = '</div>';</script><style>.a{}</style></head>"
+            "<body><svg><path/></svg><p>Keep</p></body>"
+        )
+
+        assert strip_noise_markup(html) == "<head></head><body><p>Keep</p></body>"
+
+    def test_cap_cuts_before_closing_tag(self):
+        """Test that oversized markup is cut at a tag boundary below the cap."""
+        html = "<div><p>text</p></div>" * (HARD_HTML_CAP // 10)
+
+        capped = _cap_html(html)
+
+        assert len(capped) <= HARD_HTML_CAP
+        assert html.startswith(capped)
+        assert html[len(capped) :].startswith("</")
+
+    def test_keeps_json_ld(self):
+        """Test that JSON-LD scripts survive for structured data extraction."""
+        html = '<script type="application/ld+json">{"@type": "JobPosting"}</script>'
+
+        assert strip_noise_markup(html) == html
+
+
+class TestParseJobPostingLd:
+    """Tests for JSON-LD JobPosting parsing."""
+
+    def test_extracts_job_fields(self):
+        """Test title, company, location (list form) and employment type."""
+        data = {
+            "@type": "JobPosting",
+            "title": "Backend Engineer",
+            "hiringOrganization": {"name": "Acme"},
+            "jobLocation": [{"address": {"addressLocality": "Madrid", "addressCountry": "ES"}}],
+            "employmentType": "FULL_TIME",
+        }
+
+        assert parse_jobposting_ld(data) == {
+            "title": "Backend Engineer",
+            "company": "Acme",
+            "location": "Madrid, ES",
+            "employment_type": "FULL_TIME",
+        }
+
+    def test_ignores_other_types(self):
+        """Test that non-JobPosting objects are skipped."""
+        assert parse_jobposting_ld({"@type": "Organization", "name": "Acme"}) is None
+        assert parse_jobposting_ld(["not", "a", "dict"]) is None
+
+
+class TestRemoveNoiseElements:
+    """Tests for post-parse noise removal."""
+
+    def test_removes_hidden_and_comments(self):
+        """Test removal of hidden elements, comments and iframes."""
+        soup = BeautifulSoup(
+            "<body><!-- note --><div hidden>x</div><div aria-hidden='true'>y</div>"
+            "<iframe></iframe><p>Keep</p></body>",
+            "lxml",
+        )
+
+        _remove_noise_elements(soup)
+
+        assert str(soup.body) == "<body><p>Keep</p></body>"
+
+    def test_keeps_nav_with_job_keywords(self):
+        """Test that nav/footer is only removed when it has no job info."""
+        soup = BeautifulSoup(
+            "<body><nav>Home About</nav><footer>Apply now</footer></body>", "lxml"
+        )
+
+        _remove_noise_elements(soup)
+
+        assert soup.find("nav") is None
+        assert soup.find("footer") is not None
+
+
+class TestHtmlToText:
+    """Tests for markdown emission."""
+
+    def test_markdown_elements(self):
+        """Test headings, emphasis, links and lists."""
+        soup = BeautifulSoup(
+            "<main><h2>Role</h2><p>We use <strong>Python</strong> at "
+            "<a href='https://acme.io'>Acme</a> <a href='#top'>top</a></p>"
+            "<ul><li>SQL</li></ul><ol><li>Apply</li><li>Interview</li></ol></main>",
+            "lxml",
+        )
+
+        text = _postprocess_text(_html_to_text(soup.main))
+
+        assert text.splitlines() == [
+            "## Role",
+            "We use **Python** at [Acme](https://acme.io) top",
+            "- SQL",
+            "1. Apply",
+            "2. Interview",
+        ]
+
+
+class TestPostprocessText:
+    """Tests for text post-processing."""
+
+    def test_drops_blank_and_symbol_lines(self):
+        """Test that blank and symbol-only lines are removed."""
+        assert _postprocess_text("a\n\n\n---\n  \n* * *\nb") == "a\n* * *\nb"
+
+    def test_collapses_spaces(self):
+        """Test that runs of spaces are collapsed."""
+        assert _postprocess_text("  a    b  ") == "a b"
+
+
+class TestCleanHtmlForExtraction:
+    """Tests for the full cleaning pipeline."""
+
+    def test_prepends_structured_data(self):
+        """Test that JSON-LD job data is placed before the page content."""
+        html = (
+            '<html><head><script type="application/ld+json">'
+            '{"@type": "JobPosting", "title": "Backend Engineer",'
+            ' "hiringOrganization": {"name": "Acme"}}</script></head>'
+            "<body><main><h1>Backend Engineer</h1></main></body></html>"
+        )
+
+        cleaned = clean_html_for_extraction(html)
+
+        assert cleaned.startswith("=== STRUCTURED DATA (JSON-LD) ===\nJob Title: Backend Engineer")
+        assert "Company: Acme" in cleaned
+        assert cleaned.endswith("=== PAGE CONTENT ===\n# Backend Engineer")
+
+    def test_truncates_to_max_length(self):
+        """Test output truncation."""
+        html = "<body><p>" + "word " * 1000 + "</p></body>"
+
+        assert len(clean_html_for_extraction(html, max_length=100)) == 100
@@ -16,12 +16,40 @@ from src.agents.email_parser import (
 )
 
 
+@pytest.fixture(scope="module")
+def email_parser_agent():
+    """One parser agent for the module; tests must not leave it modified."""
+    return EmailParserAgent(claude_api_key="test-key")
+
+
+@pytest.fixture(scope="session")
+def base_email():
+    """Email used as scaffolding; derive variants with model_copy(update=...)."""
+    return EmailContent(
+        subject="Test",
+        sender="test@test.com",
+        body="Content",
+        received_at="2024-01-15T10:00:00Z",
+    )
+
+
+@pytest.fixture(scope="session")
+def base_job():
+    """Job used as scaffolding; derive variants with model_copy(update=...)."""
+    return ExtractedJob(
+        title="AI Engineer",
+        company="TechCorp",
+        job_url="https://example.com/job",
+        source_platform="LinkedIn",
+    )
+
+
 class TestEmailParserAgent:
     """Tests for EmailParserAgent."""
 
-    def test_email_parser_properties(self):
+    def test_email_parser_properties(self, email_parser_agent):
         """Test agent properties."""
-        agent = EmailParserAgent(claude_api_key="test-key")
+        agent = email_parser_agent
 
         assert agent.name == "email_parser"
         assert agent.model  # Model is set from settings (Anthropic or Bedrock)
@@ -82,29 +110,16 @@ class TestEmailParserAgent:
         assert job.location is None
         assert job.salary_range is None
 
-    def test_email_parser_input_validation(self):
+    def test_email_parser_input_validation(self, base_email):
         """Test EmailParserInput validation."""
-        email = EmailContent(
-            subject="Test",
-            sender="test@test.com",
-            body="Content",
-            received_at="2024-01-15T10:00:00Z",
-        )
-        parser_input = EmailParserInput(email=email, extract_all=True)
+        parser_input = EmailParserInput(email=base_email, extract_all=True)
 
         assert parser_input.extract_all is True
 
-    def test_email_parser_output_validation(self):
+    def test_email_parser_output_validation(self, base_job):
         """Test EmailParserOutput validation."""
         output = EmailParserOutput(
-            jobs=[
-                ExtractedJob(
-                    title="AI Engineer",
-                    company="TechCorp",
-                    job_url="https://example.com/job",
-                    source_platform="LinkedIn",
-                )
-            ],
+            jobs=[base_job],
             source_platform="LinkedIn",
             is_job_alert=True,
             confidence=0.95,
@@ -115,49 +130,32 @@ class TestEmailParserAgent:
         assert output.is_job_alert is True
         assert output.confidence == 0.95
 
-    def test_confidence_bounds(self):
+    @pytest.mark.parametrize("confidence", [0.5, 0.0, 1.0])
+    def test_confidence_bounds(self, confidence):
         """Test confidence score bounds validation."""
-        # Valid confidence
         output = EmailParserOutput(
             jobs=[],
             source_platform="Unknown",
             is_job_alert=False,
-            confidence=0.5,
-            raw_job_count=0,
-        )
-        assert output.confidence == 0.5
-
-        # Edge cases
-        output_min = EmailParserOutput(
-            jobs=[],
-            source_platform="Unknown",
-            is_job_alert=False,
-            confidence=0.0,
+            confidence=confidence,
             raw_job_count=0,
         )
-        assert output_min.confidence == 0.0
 
-        output_max = EmailParserOutput(
-            jobs=[],
-            source_platform="Unknown",
-            is_job_alert=False,
-            confidence=1.0,
-            raw_job_count=0,
-        )
-        assert output_max.confidence == 1.0
+        assert output.confidence == confidence
 
     @pytest.mark.asyncio
-    async def test_email_parser_run(self):
+    async def test_email_parser_run(self, email_parser_agent, base_email, base_job):
         """Test email parser execution with mocked Claude response."""
         mock_response = EmailParserOutput(
             jobs=[
-                ExtractedJob(
-                    title="Data Scientist",
-                    company="DataCo",
-                    location="Remote",
-                    job_url="https://linkedin.com/jobs/456",
-                    source_platform="LinkedIn",
-                    job_type="remote",
+                base_job.model_copy(
+                    update={
+                        "title": "Data Scientist",
+                        "company": "DataCo",
+                        "location": "Remote",
+                        "job_url": "https://linkedin.com/jobs/456",
+                        "job_type": "remote",
+                    }
                 )
             ],
             source_platform="LinkedIn",
@@ -166,16 +164,17 @@ class TestEmailParserAgent:
             raw_job_count=1,
         )
 
-        agent = EmailParserAgent(claude_api_key="test-key")
+        agent = email_parser_agent
 
         with patch.object(agent, "_call_claude_json", new_callable=AsyncMock) as mock_call:
             mock_call.return_value = mock_response
 
-            email = EmailContent(
-                subject="LinkedIn: Data Scientist at DataCo",
-                sender="jobs-noreply@linkedin.com",
-                body="<html>New job matching your preferences...</html>",
-                received_at="2024-01-15T10:00:00Z",
+            email = base_email.model_copy(
+                update={
+                    "subject": "LinkedIn: Data Scientist at DataCo",
+                    "sender": "jobs-noreply@linkedin.com",
+                    "body": "<html>New job matching your preferences...</html>",
+                }
             )
             result = await agent.run(EmailParserInput(email=email))
 
@@ -196,20 +195,19 @@ class TestEmailBatchParserAgent:
         assert agent.model  # Model is set from settings (Anthropic or Bedrock)
         assert agent.max_tokens == 8192
 
-    def test_batch_input_validation(self):
+    def test_batch_input_validation(self, base_email):
         """Test EmailBatchParserInput validation."""
         emails = [
-            EmailContent(
-                subject="Job 1",
-                sender="jobs@linkedin.com",
-                body="Content 1",
-                received_at="2024-01-15T10:00:00Z",
+            base_email.model_copy(
+                update={"subject": "Job 1", "sender": "jobs@linkedin.com", "body": "Content 1"}
             ),
-            EmailContent(
-                subject="Job 2",
-                sender="jobs@indeed.com",
-                body="Content 2",
-                received_at="2024-01-15T11:00:00Z",
+            base_email.model_copy(
+                update={
+                    "subject": "Job 2",
+                    "sender": "jobs@indeed.com",
+                    "body": "Content 2",
+                    "received_at": "2024-01-15T11:00:00Z",
+                }
             ),
         ]
         batch_input = EmailBatchParserInput(emails=emails, filter_job_alerts_only=True)
@@ -241,14 +239,15 @@ class TestEmailBatchParserAgent:
 class TestEmailParserPrompt:
     """Tests for email parser prompt building."""
 
-    def test_prompt_contains_email_metadata(self):
+    def test_prompt_contains_email_metadata(self, email_parser_agent, base_email):
         """Test that prompt includes email metadata."""
-        agent = EmailParserAgent(claude_api_key="test-key")
-        email = EmailContent(
-            subject="New AI Jobs",
-            sender="alerts@jobsite.com",
-            body="Here are new jobs for you...",
-            received_at="2024-01-15T10:00:00Z",
+        agent = email_parser_agent
+        email = base_email.model_copy(
+            update={
+                "subject": "New AI Jobs",
+                "sender": "alerts@jobsite.com",
+                "body": "Here are new jobs for you...",
+            }
         )
         input_data = EmailParserInput(email=email)
 
@@ -258,11 +257,9 @@ class TestEmailParserPrompt:
         assert "alerts@jobsite.com" in prompt
         assert "Here are new jobs for you..." in prompt
 
-    def test_system_prompt_content(self):
+    def test_system_prompt_content(self, email_parser_agent):
         """Test system prompt contains key instructions."""
-        agent = EmailParserAgent(claude_api_key="test-key")
-
-        system_prompt = agent.system_prompt
+        system_prompt = email_parser_agent.system_prompt
 
         assert "job alerts" in system_prompt.lower()
         assert "LinkedIn" in system_prompt
@@ -0,0 +1,54 @@
+"""Tests for the email pipeline Gemini fallback pre-check."""
+
+import pytest
+
+from src.services.email_pipeline import _should_try_gemini
+
+LISTING_BODY = (
+    "We found new jobs matching your search. "
+    + "See the full description at https://jobs.example.com/view/123 " * 5
+)
+
+
+class TestShouldTryGemini:
+    """Tests for _should_try_gemini."""
+
+    def test_short_body_is_skipped(self):
+        """Test that bodies too short to hold a listing are skipped."""
+        assert _should_try_gemini("Thanks! https://x.io", "New jobs for you") is False
+
+    def test_body_without_links_is_skipped(self):
+        """Test that long bodies with no links or anchors are skipped."""
+        assert _should_try_gemini("plain text " * 50, "New jobs for you") is False
+
+    def test_html_anchor_counts_as_link(self):
+        """Test that an anchor tag is enough markup to try Gemini."""
+        body = "<p>" + "Senior Engineer role " * 20 + '<A HREF="/view/1">View</A></p>'
+        assert _should_try_gemini(body, "New jobs for you") is True
+
+    @pytest.mark.parametrize(
+        "subject",
+        [
+            "Payment Systems Engineer at Stripe",
+            "Security Alert Analyst - remote",
+            "Password Manager Backend Developer",
+            "Newsletter Editor and 4 more jobs",
+            "",
+        ],
+    )
+    def test_job_titles_are_not_blocked(self, subject):
+        """Test that job titles sharing words with account mail still reach Gemini."""
+        assert _should_try_gemini(LISTING_BODY, subject) is True
+
+    @pytest.mark.parametrize(
+        "subject",
+        [
+            "Your receipt from Acme",
+            "Invoice #1234 for October",
+            "Order Confirmation - #5678",
+            "Your verification code",
+        ],
+    )
+    def test_transactional_subjects_are_skipped(self, subject):
+        """Test that unambiguous transactional subjects skip the Gemini call."""
+        assert _should_try_gemini(LISTING_BODY, subject) is False
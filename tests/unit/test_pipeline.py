@@ -1,5 +1,7 @@
 """Tests for Application Pipeline improvements."""
 
+import pytest
+
 from src.automation.application_pipeline import (
     ApplicationAttempt,
     ApplicationPipeline,
@@ -7,24 +9,57 @@ from src.automation.application_pipeline import (
     PipelineReport,
 )
 
+REPORT_DEFAULTS = {
+    "completed_at": None,
+    "total_jobs": 0,
+    "successful": 0,
+    "paused": 0,
+    "blocked": 0,
+    "failed": 0,
+    "skipped": 0,
+    "job_closed": 0,
+    "attempts": [],
+}
+
+
+def _make_attempt(n: int, result: ApplicationResult = ApplicationResult.SUCCESS):
+    """Build the n-th sample attempt with the given result."""
+    return ApplicationAttempt(
+        job_id=f"job{n}",
+        job_url=f"https://example.com/{n}",
+        job_title=f"Job {n}",
+        company=f"Co{n}",
+        result=result,
+    )
+
+
+@pytest.fixture(scope="module")
+def default_pipeline():
+    """Pipeline with default configuration, shared by read-only tests."""
+    return ApplicationPipeline(user_id="test-user")
+
+
+@pytest.fixture
+def pipeline(default_pipeline):
+    """Shared pipeline for tests that flip the LinkedIn session flag."""
+    yield default_pipeline
+    default_pipeline._has_linkedin_session = False
+
 
 class TestPipelineConfiguration:
     """Tests for pipeline configuration."""
 
-    def test_default_delay_is_60_seconds(self):
+    def test_default_delay_is_60_seconds(self, default_pipeline):
         """Test that default delay between applications is 60 seconds."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        assert pipeline.delay_between_apps == 60
+        assert default_pipeline.delay_between_apps == 60
 
-    def test_default_max_retries_is_3(self):
+    def test_default_max_retries_is_3(self, default_pipeline):
         """Test that default max retries is 3."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        assert pipeline.max_retries == 3
+        assert default_pipeline.max_retries == 3
 
-    def test_default_retry_delay_is_120_seconds(self):
+    def test_default_retry_delay_is_120_seconds(self, default_pipeline):
         """Test that default retry delay is 120 seconds."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        assert pipeline.retry_delay == 120
+        assert default_pipeline.retry_delay == 120
 
     def test_custom_configuration(self):
         """Test that custom configuration is applied."""
@@ -48,147 +83,101 @@ class TestRetryableErrors:
         assert hasattr(ApplicationPipeline, "RETRYABLE_ERRORS")
         assert len(ApplicationPipeline.RETRYABLE_ERRORS) > 0
 
-    def test_429_is_retryable(self):
-        """Test that 429 errors are considered retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert pipeline._is_retryable_error("Error 429: Too Many Requests")
-        assert pipeline._is_retryable_error("HTTP 429")
-        assert pipeline._is_retryable_error("API returned 429")
-
-    def test_rate_limit_is_retryable(self):
-        """Test that rate limit errors are retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert pipeline._is_retryable_error("Rate limit exceeded")
-        assert pipeline._is_retryable_error("rate limit reached")
-        assert pipeline._is_retryable_error("Too Many Requests")
-
-    def test_taskgroup_is_retryable(self):
-        """Test that TaskGroup errors are retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert pipeline._is_retryable_error("unhandled errors in a TaskGroup (1 sub-exception)")
-        assert pipeline._is_retryable_error("TaskGroup failed")
-
-    def test_timeout_is_retryable(self):
-        """Test that timeout errors are retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert pipeline._is_retryable_error("Connection timeout")
-        assert pipeline._is_retryable_error("Request timeout after 30s")
-
-    def test_connection_is_retryable(self):
-        """Test that connection errors are retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert pipeline._is_retryable_error("Connection refused")
-        assert pipeline._is_retryable_error("connection reset by peer")
-
-    def test_none_is_not_retryable(self):
-        """Test that None error is not retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert not pipeline._is_retryable_error(None)
-
-    def test_permanent_errors_not_retryable(self):
-        """Test that permanent errors are not retryable."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        assert not pipeline._is_retryable_error("Invalid API key")
-        assert not pipeline._is_retryable_error("User not found")
-        assert not pipeline._is_retryable_error("Job already applied")
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("Error 429: Too Many Requests", True),
+            ("HTTP 429", True),
+            ("API returned 429", True),
+            ("Rate limit exceeded", True),
+            ("rate limit reached", True),
+            ("Too Many Requests", True),
+            ("unhandled errors in a TaskGroup (1 sub-exception)", True),
+            ("TaskGroup failed", True),
+            ("Connection timeout", True),
+            ("Request timeout after 30s", True),
+            ("Connection refused", True),
+            ("connection reset by peer", True),
+            (None, False),
+            ("Invalid API key", False),
+            ("User not found", False),
+            ("Job already applied", False),
+        ],
+    )
+    def test_is_retryable_error(self, default_pipeline, message, expected):
+        """Test that rate limits, timeouts and connection errors are retried, others are not."""
+        assert default_pipeline._is_retryable_error(message) is expected
 
 
 class TestLinkedInSkipLogic:
     """Tests for LinkedIn job skip logic."""
 
-    def test_linkedin_jobs_skipped_without_session(self):
-        """Test that LinkedIn jobs are skipped when no session."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        pipeline._has_linkedin_session = False
-
-        assert pipeline._should_skip_job("https://linkedin.com/jobs/view/123")
-        assert pipeline._should_skip_job("https://www.linkedin.com/jobs/view/456")
-        assert pipeline._should_skip_job("https://linkedin.com/comm/jobs/789")
-
-    def test_linkedin_jobs_not_skipped_with_session(self):
-        """Test that LinkedIn jobs are attempted when session exists."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        pipeline._has_linkedin_session = True
-
-        assert not pipeline._should_skip_job("https://linkedin.com/jobs/view/123")
-        assert not pipeline._should_skip_job("https://www.linkedin.com/jobs/view/456")
-
-    def test_indeed_jobs_always_skipped(self):
-        """Test that Indeed jobs are always skipped."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-
-        # Even with LinkedIn session, Indeed should be skipped
-        pipeline._has_linkedin_session = True
-        assert pipeline._should_skip_job("https://indeed.com/job/123")
-        assert pipeline._should_skip_job("https://www.indeed.com/viewjob?id=456")
-
-        pipeline._has_linkedin_session = False
-        assert pipeline._should_skip_job("https://indeed.com/job/123")
-
-    def test_other_jobs_not_skipped(self):
-        """Test that other job URLs are not skipped."""
-        pipeline = ApplicationPipeline(user_id="test-user")
-        pipeline._has_linkedin_session = False
-
-        assert not pipeline._should_skip_job("https://greenhouse.io/job/123")
-        assert not pipeline._should_skip_job("https://lever.co/company/job")
-        assert not pipeline._should_skip_job("https://workable.com/j/abc")
-        assert not pipeline._should_skip_job("https://app.jackandjill.ai/jobs/xyz")
+    @pytest.mark.parametrize(
+        "url,has_linkedin_session,expected",
+        [
+            # LinkedIn jobs are only attempted when LinkedIn is connected
+            ("https://linkedin.com/jobs/view/123", False, True),
+            ("https://www.linkedin.com/jobs/view/456", False, True),
+            ("https://linkedin.com/comm/jobs/789", False, True),
+            ("https://uk.linkedin.com/jobs/view/321", False, True),
+            ("www.linkedin.com/jobs/view/654", False, True),
+            ("linkedin.com/jobs/view/654", True, False),
+            ("https://linkedin.com/jobs/view/123", True, False),
+            ("https://www.linkedin.com/jobs/view/456", True, False),
+            # Indeed is skipped even with a LinkedIn session
+            ("https://indeed.com/job/123", True, True),
+            ("https://www.indeed.com/viewjob?id=456", True, True),
+            ("https://indeed.com/job/123", False, True),
+            ("www.indeed.com/viewjob?id=789", False, True),
+            ("https://greenhouse.io/job/123", False, False),
+            ("https://lever.co/company/job", False, False),
+            ("https://workable.com/j/abc", False, False),
+            ("https://app.jackandjill.ai/jobs/xyz", False, False),
+            ("boards.greenhouse.io/acme/jobs/2", False, False),
+            # Only the host counts, not a mention elsewhere in the URL
+            ("https://boards.greenhouse.io/acme/jobs/1?source=linkedin.com", False, False),
+        ],
+    )
+    def test_should_skip_job(self, pipeline, url, has_linkedin_session, expected):
+        """Test which job URLs are skipped with and without a LinkedIn session."""
+        pipeline._has_linkedin_session = has_linkedin_session
+
+        assert pipeline._should_skip_job(url) is expected
 
 
 class TestApplicationResult:
     """Tests for ApplicationResult enum."""
 
     def test_all_result_types_exist(self):
-        """Test that all expected result types exist."""
-        assert ApplicationResult.SUCCESS.value == "success"
-        assert ApplicationResult.PAUSED.value == "paused"
-        assert ApplicationResult.BLOCKED.value == "blocked"
-        assert ApplicationResult.FAILED.value == "failed"
-        assert ApplicationResult.SKIPPED.value == "skipped"
-        assert ApplicationResult.JOB_CLOSED.value == "job_closed"
+        """Test that exactly the expected result types exist."""
+        assert {result.name: result.value for result in ApplicationResult} == {
+            "SUCCESS": "success",
+            "PAUSED": "paused",
+            "BLOCKED": "blocked",
+            "FAILED": "failed",
+            "SKIPPED": "skipped",
+            "JOB_CLOSED": "job_closed",
+        }
 
 
 class TestApplicationAttempt:
     """Tests for ApplicationAttempt model."""
 
-    def test_application_attempt_creation(self):
-        """Test that ApplicationAttempt can be created."""
-        attempt = ApplicationAttempt(
-            job_id="test-job-id",
-            job_url="https://example.com/job",
-            job_title="Software Engineer",
-            company="Test Co",
-            result=ApplicationResult.SUCCESS,
-        )
-
-        assert attempt.job_id == "test-job-id"
-        assert attempt.result == ApplicationResult.SUCCESS
-        assert attempt.fields_filled == {}
-        assert attempt.blocker_type is None
-
-    def test_application_attempt_with_blocker(self):
-        """Test ApplicationAttempt with blocker information."""
-        attempt = ApplicationAttempt(
-            job_id="test-job-id",
-            job_url="https://example.com/job",
-            job_title="Software Engineer",
-            company="Test Co",
-            result=ApplicationResult.BLOCKED,
-            blocker_type="captcha",
-            blocker_message="CAPTCHA detected on page",
-        )
+    def test_application_attempt_fields(self):
+        """Test the required fields and the defaults of the optional ones."""
+        fields = ApplicationAttempt.model_fields
 
-        assert attempt.result == ApplicationResult.BLOCKED
-        assert attempt.blocker_type == "captcha"
-        assert attempt.blocker_message == "CAPTCHA detected on page"
+        assert {name for name, field in fields.items() if field.is_required()} == {
+            "job_id",
+            "job_url",
+            "job_title",
+            "company",
+            "result",
+        }
+        assert fields["result"].annotation is ApplicationResult
+        assert fields["fields_filled"].get_default(call_default_factory=True) == {}
+        assert fields["blocker_type"].get_default() is None
+        assert fields["blocker_message"].get_default() is None
 
 
 class TestPipelineReport:
@@ -198,38 +187,16 @@ class TestPipelineReport:
         """Test that PipelineReport can be created."""
         report = PipelineReport(started_at="2025-01-01T00:00:00")
 
-        assert report.total_jobs == 0
-        assert report.successful == 0
-        assert report.paused == 0
-        assert report.blocked == 0
-        assert report.failed == 0
-        assert report.skipped == 0
-        assert report.job_closed == 0
-        assert report.attempts == []
+        assert report.model_dump(exclude={"started_at"}) == REPORT_DEFAULTS
 
     def test_pipeline_report_with_attempts(self):
         """Test PipelineReport with attempts."""
-        attempt1 = ApplicationAttempt(
-            job_id="job1",
-            job_url="https://example.com/1",
-            job_title="Job 1",
-            company="Co1",
-            result=ApplicationResult.SUCCESS,
-        )
-        attempt2 = ApplicationAttempt(
-            job_id="job2",
-            job_url="https://example.com/2",
-            job_title="Job 2",
-            company="Co2",
-            result=ApplicationResult.BLOCKED,
-        )
-
         report = PipelineReport(
             started_at="2025-01-01T00:00:00",
             total_jobs=2,
             successful=1,
             blocked=1,
-            attempts=[attempt1, attempt2],
+            attempts=[_make_attempt(1), _make_attempt(2, ApplicationResult.BLOCKED)],
         )
 
         assert report.total_jobs == 2